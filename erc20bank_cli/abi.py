@@ -0,0 +1,1489 @@
+"""ABIs, selectors and fixed layout codecs of the ERC20Bank contracts
+
+Generated by erc20bank_cli/abigen.py from config.ABIES, do not edit."""
+from eth_utils import to_checksum_address
+
+
+def _bytes(value):
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:])
+    return bytes(value)
+
+
+ABIES = {'collateral': [{'constant': True,
+                 'inputs': [],
+                 'name': 'mintingFinished',
+                 'outputs': [{'name': '', 'type': 'bool'}],
+                 'payable': False,
+                 'stateMutability': 'view',
+                 'type': 'function'},
+                {'constant': True,
+                 'inputs': [],
+                 'name': 'name',
+                 'outputs': [{'name': '', 'type': 'string'}],
+                 'payable': False,
+                 'stateMutability': 'view',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [{'name': '_spender', 'type': 'address'},
+                            {'name': '_value', 'type': 'uint256'}],
+                 'name': 'approve',
+                 'outputs': [{'name': '', 'type': 'bool'}],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': True,
+                 'inputs': [],
+                 'name': 'totalSupply',
+                 'outputs': [{'name': '', 'type': 'uint256'}],
+                 'payable': False,
+                 'stateMutability': 'view',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [{'name': '_from', 'type': 'address'},
+                            {'name': '_to', 'type': 'address'},
+                            {'name': '_value', 'type': 'uint256'}],
+                 'name': 'transferFrom',
+                 'outputs': [{'name': '', 'type': 'bool'}],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': True,
+                 'inputs': [],
+                 'name': 'decimals',
+                 'outputs': [{'name': '', 'type': 'uint32'}],
+                 'payable': False,
+                 'stateMutability': 'view',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [{'name': '_to', 'type': 'address'},
+                            {'name': '_amount', 'type': 'uint256'}],
+                 'name': 'mint',
+                 'outputs': [{'name': '', 'type': 'bool'}],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [{'name': '_value', 'type': 'uint256'}],
+                 'name': 'burn',
+                 'outputs': [],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [{'name': '_spender', 'type': 'address'},
+                            {'name': '_subtractedValue', 'type': 'uint256'}],
+                 'name': 'decreaseApproval',
+                 'outputs': [{'name': '', 'type': 'bool'}],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': True,
+                 'inputs': [{'name': '_owner', 'type': 'address'}],
+                 'name': 'balanceOf',
+                 'outputs': [{'name': '', 'type': 'uint256'}],
+                 'payable': False,
+                 'stateMutability': 'view',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [],
+                 'name': 'renounceOwnership',
+                 'outputs': [],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [],
+                 'name': 'finishMinting',
+                 'outputs': [{'name': '', 'type': 'bool'}],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': True,
+                 'inputs': [],
+                 'name': 'owner',
+                 'outputs': [{'name': '', 'type': 'address'}],
+                 'payable': False,
+                 'stateMutability': 'view',
+                 'type': 'function'},
+                {'constant': True,
+                 'inputs': [],
+                 'name': 'symbol',
+                 'outputs': [{'name': '', 'type': 'string'}],
+                 'payable': False,
+                 'stateMutability': 'view',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [{'name': '_to', 'type': 'address'},
+                            {'name': '_value', 'type': 'uint256'}],
+                 'name': 'transfer',
+                 'outputs': [{'name': '', 'type': 'bool'}],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [{'name': '_spender', 'type': 'address'},
+                            {'name': '_addedValue', 'type': 'uint256'}],
+                 'name': 'increaseApproval',
+                 'outputs': [{'name': '', 'type': 'bool'}],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': True,
+                 'inputs': [{'name': '_owner', 'type': 'address'},
+                            {'name': '_spender', 'type': 'address'}],
+                 'name': 'allowance',
+                 'outputs': [{'name': '', 'type': 'uint256'}],
+                 'payable': False,
+                 'stateMutability': 'view',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [{'name': '_newOwner', 'type': 'address'}],
+                 'name': 'transferOwnership',
+                 'outputs': [],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'anonymous': False,
+                 'inputs': [{'indexed': True,
+                             'name': 'burner',
+                             'type': 'address'},
+                            {'indexed': False,
+                             'name': 'value',
+                             'type': 'uint256'}],
+                 'name': 'Burn',
+                 'type': 'event'},
+                {'anonymous': False,
+                 'inputs': [{'indexed': True, 'name': 'to', 'type': 'address'},
+                            {'indexed': False,
+                             'name': 'amount',
+                             'type': 'uint256'}],
+                 'name': 'Mint',
+                 'type': 'event'},
+                {'anonymous': False,
+                 'inputs': [],
+                 'name': 'MintFinished',
+                 'type': 'event'},
+                {'anonymous': False,
+                 'inputs': [{'indexed': True,
+                             'name': 'previousOwner',
+                             'type': 'address'}],
+                 'name': 'OwnershipRenounced',
+                 'type': 'event'},
+                {'anonymous': False,
+                 'inputs': [{'indexed': True,
+                             'name': 'previousOwner',
+                             'type': 'address'},
+                            {'indexed': True,
+                             'name': 'newOwner',
+                             'type': 'address'}],
+                 'name': 'OwnershipTransferred',
+                 'type': 'event'},
+                {'anonymous': False,
+                 'inputs': [{'indexed': True,
+                             'name': 'owner',
+                             'type': 'address'},
+                            {'indexed': True,
+                             'name': 'spender',
+                             'type': 'address'},
+                            {'indexed': False,
+                             'name': 'value',
+                             'type': 'uint256'}],
+                 'name': 'Approval',
+                 'type': 'event'},
+                {'anonymous': False,
+                 'inputs': [{'indexed': True,
+                             'name': 'from',
+                             'type': 'address'},
+                            {'indexed': True, 'name': 'to', 'type': 'address'},
+                            {'indexed': False,
+                             'name': 'value',
+                             'type': 'uint256'}],
+                 'name': 'Transfer',
+                 'type': 'event'}],
+ 'erc20bank': [{'constant': True,
+                'inputs': [],
+                'name': 'oraclesAddr',
+                'outputs': [{'name': '', 'type': 'address'}],
+                'payable': False,
+                'stateMutability': 'view',
+                'type': 'function'},
+               {'constant': True,
+                'inputs': [],
+                'name': 'collateralPrice',
+                'outputs': [{'name': '', 'type': 'uint256'}],
+                'payable': False,
+                'stateMutability': 'view',
+                'type': 'function'},
+               {'constant': True,
+                'inputs': [],
+                'name': 'lastLoanId',
+                'outputs': [{'name': '', 'type': 'uint256'}],
+                'payable': False,
+                'stateMutability': 'view',
+                'type': 'function'},
+               {'constant': True,
+                'inputs': [],
+                'name': 'liquidatorAddr',
+                'outputs': [{'name': '', 'type': 'address'}],
+                'payable': False,
+                'stateMutability': 'view',
+                'type': 'function'},
+               {'constant': False,
+                'inputs': [],
+                'name': 'renounceOwnership',
+                'outputs': [],
+                'payable': False,
+                'stateMutability': 'nonpayable',
+                'type': 'function'},
+               {'constant': True,
+                'inputs': [],
+                'name': 'owner',
+                'outputs': [{'name': '', 'type': 'address'}],
+                'payable': False,
+                'stateMutability': 'view',
+                'type': 'function'},
+               {'constant': True,
+                'inputs': [],
+                'name': 'liquidationDuration',
+                'outputs': [{'name': '', 'type': 'uint256'}],
+                'payable': False,
+                'stateMutability': 'view',
+                'type': 'function'},
+               {'constant': True,
+                'inputs': [],
+                'name': 'collateralRatio',
+                'outputs': [{'name': '', 'type': 'uint256'}],
+                'payable': False,
+                'stateMutability': 'view',
+                'type': 'function'},
+               {'constant': True,
+                'inputs': [{'name': '', 'type': 'uint256'}],
+                'name': 'loans',
+                'outputs': [{'name': 'recipient', 'type': 'address'},
+                            {'name': 'collateralAmount', 'type': 'uint256'},
+                            {'name': 'amount', 'type': 'uint256'},
+                            {'name': 'state', 'type': 'uint8'}],
+                'payable': False,
+                'stateMutability': 'view',
+                'type': 'function'},
+               {'constant': False,
+                'inputs': [{'name': '_newOwner', 'type': 'address'}],
+                'name': 'transferOwnership',
+                'outputs': [],
+                'payable': False,
+                'stateMutability': 'nonpayable',
+                'type': 'function'},
+               {'constant': True,
+                'inputs': [],
+                'name': 'etherDollarAddr',
+                'outputs': [{'name': '', 'type': 'address'}],
+                'payable': False,
+                'stateMutability': 'view',
+                'type': 'function'},
+               {'inputs': [{'name': 'tokenAddr', 'type': 'address'}],
+                'payable': False,
+                'stateMutability': 'nonpayable',
+                'type': 'constructor'},
+               {'anonymous': False,
+                'inputs': [{'indexed': True,
+                            'name': 'recipient',
+                            'type': 'address'},
+                           {'indexed': True,
+                            'name': 'loanId',
+                            'type': 'uint256'},
+                           {'indexed': False,
+                            'name': 'amount',
+                            'type': 'uint256'},
+                           {'indexed': False,
+                            'name': 'collateralAmount',
+                            'type': 'uint256'}],
+                'name': 'LoanGot',
+                'type': 'event'},
+               {'anonymous': False,
+                'inputs': [{'indexed': False,
+                            'name': 'recipient',
+                            'type': 'address'},
+                           {'indexed': True,
+                            'name': 'loanId',
+                            'type': 'uint256'},
+                           {'indexed': False,
+                            'name': 'collateralAmount',
+                            'type': 'uint256'},
+                           {'indexed': False,
+                            'name': 'amount',
+                            'type': 'uint256'}],
+                'name': 'LoanSettled',
+                'type': 'event'},
+               {'anonymous': False,
+                'inputs': [{'indexed': True,
+                            'name': 'recipient',
+                            'type': 'address'},
+                           {'indexed': True,
+                            'name': 'loanId',
+                            'type': 'uint256'},
+                           {'indexed': False,
+                            'name': 'collateralAmount',
+                            'type': 'uint256'}],
+                'name': 'CollateralIncreased',
+                'type': 'event'},
+               {'anonymous': False,
+                'inputs': [{'indexed': True,
+                            'name': 'recipient',
+                            'type': 'address'},
+                           {'indexed': True,
+                            'name': 'loanId',
+                            'type': 'uint256'},
+                           {'indexed': False,
+                            'name': 'collateralAmount',
+                            'type': 'uint256'}],
+                'name': 'CollateralDecreased',
+                'type': 'event'},
+               {'anonymous': False,
+                'inputs': [{'indexed': False,
+                            'name': 'amount',
+                            'type': 'uint256'}],
+                'name': 'Discharged',
+                'type': 'event'},
+               {'anonymous': False,
+                'inputs': [{'indexed': True,
+                            'name': 'previousOwner',
+                            'type': 'address'}],
+                'name': 'OwnershipRenounced',
+                'type': 'event'},
+               {'anonymous': False,
+                'inputs': [{'indexed': True,
+                            'name': 'previousOwner',
+                            'type': 'address'},
+                           {'indexed': True,
+                            'name': 'newOwner',
+                            'type': 'address'}],
+                'name': 'OwnershipTransferred',
+                'type': 'event'},
+               {'constant': False,
+                'inputs': [{'name': 'amount', 'type': 'uint256'}],
+                'name': 'discharge',
+                'outputs': [],
+                'payable': False,
+                'stateMutability': 'nonpayable',
+                'type': 'function'},
+               {'constant': False,
+                'inputs': [{'name': '_liquidatorAddr', 'type': 'address'}],
+                'name': 'setLiquidator',
+                'outputs': [],
+                'payable': False,
+                'stateMutability': 'nonpayable',
+                'type': 'function'},
+               {'constant': False,
+                'inputs': [{'name': '_oraclesAddr', 'type': 'address'}],
+                'name': 'setOracle',
+                'outputs': [],
+                'payable': False,
+                'stateMutability': 'nonpayable',
+                'type': 'function'},
+               {'constant': False,
+                'inputs': [{'name': '_type', 'type': 'uint8'},
+                           {'name': 'value', 'type': 'uint256'}],
+                'name': 'setVariable',
+                'outputs': [],
+                'payable': False,
+                'stateMutability': 'nonpayable',
+                'type': 'function'},
+               {'constant': False,
+                'inputs': [{'name': 'amount', 'type': 'uint256'}],
+                'name': 'getLoan',
+                'outputs': [],
+                'payable': True,
+                'stateMutability': 'payable',
+                'type': 'function'},
+               {'constant': False,
+                'inputs': [{'name': 'loanId', 'type': 'uint256'}],
+                'name': 'increaseCollateral',
+                'outputs': [],
+                'payable': True,
+                'stateMutability': 'payable',
+                'type': 'function'},
+               {'constant': False,
+                'inputs': [{'name': 'loanId', 'type': 'uint256'},
+                           {'name': 'amount', 'type': 'uint256'}],
+                'name': 'decreaseCollateral',
+                'outputs': [],
+                'payable': False,
+                'stateMutability': 'nonpayable',
+                'type': 'function'},
+               {'constant': False,
+                'inputs': [{'name': 'loanId', 'type': 'uint256'},
+                           {'name': 'amount', 'type': 'uint256'}],
+                'name': 'settleLoan',
+                'outputs': [],
+                'payable': False,
+                'stateMutability': 'nonpayable',
+                'type': 'function'},
+               {'constant': False,
+                'inputs': [{'name': 'loanId', 'type': 'uint256'}],
+                'name': 'liquidate',
+                'outputs': [],
+                'payable': False,
+                'stateMutability': 'nonpayable',
+                'type': 'function'},
+               {'constant': False,
+                'inputs': [{'name': 'loanId', 'type': 'uint256'},
+                           {'name': 'collateral', 'type': 'uint256'},
+                           {'name': 'buyer', 'type': 'address'}],
+                'name': 'liquidated',
+                'outputs': [{'name': '', 'type': 'bool'}],
+                'payable': False,
+                'stateMutability': 'nonpayable',
+                'type': 'function'},
+               {'constant': True,
+                'inputs': [{'name': 'amount', 'type': 'uint256'}],
+                'name': 'minCollateral',
+                'outputs': [{'name': '', 'type': 'uint256'}],
+                'payable': False,
+                'stateMutability': 'view',
+                'type': 'function'}],
+ 'etherdollar': [{'constant': True,
+                  'inputs': [],
+                  'name': 'mintingFinished',
+                  'outputs': [{'name': '', 'type': 'bool'}],
+                  'payable': False,
+                  'stateMutability': 'view',
+                  'type': 'function'},
+                 {'constant': True,
+                  'inputs': [],
+                  'name': 'name',
+                  'outputs': [{'name': '', 'type': 'string'}],
+                  'payable': False,
+                  'stateMutability': 'view',
+                  'type': 'function'},
+                 {'constant': False,
+                  'inputs': [{'name': '_spender', 'type': 'address'},
+                             {'name': '_value', 'type': 'uint256'}],
+                  'name': 'approve',
+                  'outputs': [{'name': '', 'type': 'bool'}],
+                  'payable': False,
+                  'stateMutability': 'nonpayable',
+                  'type': 'function'},
+                 {'constant': True,
+                  'inputs': [],
+                  'name': 'totalSupply',
+                  'outputs': [{'name': '', 'type': 'uint256'}],
+                  'payable': False,
+                  'stateMutability': 'view',
+                  'type': 'function'},
+                 {'constant': False,
+                  'inputs': [{'name': '_from', 'type': 'address'},
+                             {'name': '_to', 'type': 'address'},
+                             {'name': '_value', 'type': 'uint256'}],
+                  'name': 'transferFrom',
+                  'outputs': [{'name': '', 'type': 'bool'}],
+                  'payable': False,
+                  'stateMutability': 'nonpayable',
+                  'type': 'function'},
+                 {'constant': True,
+                  'inputs': [],
+                  'name': 'decimals',
+                  'outputs': [{'name': '', 'type': 'uint32'}],
+                  'payable': False,
+                  'stateMutability': 'view',
+                  'type': 'function'},
+                 {'constant': False,
+                  'inputs': [{'name': '_to', 'type': 'address'},
+                             {'name': '_amount', 'type': 'uint256'}],
+                  'name': 'mint',
+                  'outputs': [{'name': '', 'type': 'bool'}],
+                  'payable': False,
+                  'stateMutability': 'nonpayable',
+                  'type': 'function'},
+                 {'constant': False,
+                  'inputs': [{'name': '_value', 'type': 'uint256'}],
+                  'name': 'burn',
+                  'outputs': [],
+                  'payable': False,
+                  'stateMutability': 'nonpayable',
+                  'type': 'function'},
+                 {'constant': False,
+                  'inputs': [{'name': '_spender', 'type': 'address'},
+                             {'name': '_subtractedValue', 'type': 'uint256'}],
+                  'name': 'decreaseApproval',
+                  'outputs': [{'name': '', 'type': 'bool'}],
+                  'payable': False,
+                  'stateMutability': 'nonpayable',
+                  'type': 'function'},
+                 {'constant': True,
+                  'inputs': [{'name': '_owner', 'type': 'address'}],
+                  'name': 'balanceOf',
+                  'outputs': [{'name': '', 'type': 'uint256'}],
+                  'payable': False,
+                  'stateMutability': 'view',
+                  'type': 'function'},
+                 {'constant': False,
+                  'inputs': [],
+                  'name': 'renounceOwnership',
+                  'outputs': [],
+                  'payable': False,
+                  'stateMutability': 'nonpayable',
+                  'type': 'function'},
+                 {'constant': False,
+                  'inputs': [],
+                  'name': 'finishMinting',
+                  'outputs': [{'name': '', 'type': 'bool'}],
+                  'payable': False,
+                  'stateMutability': 'nonpayable',
+                  'type': 'function'},
+                 {'constant': True,
+                  'inputs': [],
+                  'name': 'owner',
+                  'outputs': [{'name': '', 'type': 'address'}],
+                  'payable': False,
+                  'stateMutability': 'view',
+                  'type': 'function'},
+                 {'constant': True,
+                  'inputs': [],
+                  'name': 'symbol',
+                  'outputs': [{'name': '', 'type': 'string'}],
+                  'payable': False,
+                  'stateMutability': 'view',
+                  'type': 'function'},
+                 {'constant': False,
+                  'inputs': [{'name': '_to', 'type': 'address'},
+                             {'name': '_value', 'type': 'uint256'}],
+                  'name': 'transfer',
+                  'outputs': [{'name': '', 'type': 'bool'}],
+                  'payable': False,
+                  'stateMutability': 'nonpayable',
+                  'type': 'function'},
+                 {'constant': False,
+                  'inputs': [{'name': '_spender', 'type': 'address'},
+                             {'name': '_addedValue', 'type': 'uint256'}],
+                  'name': 'increaseApproval',
+                  'outputs': [{'name': '', 'type': 'bool'}],
+                  'payable': False,
+                  'stateMutability': 'nonpayable',
+                  'type': 'function'},
+                 {'constant': True,
+                  'inputs': [{'name': '_owner', 'type': 'address'},
+                             {'name': '_spender', 'type': 'address'}],
+                  'name': 'allowance',
+                  'outputs': [{'name': '', 'type': 'uint256'}],
+                  'payable': False,
+                  'stateMutability': 'view',
+                  'type': 'function'},
+                 {'constant': False,
+                  'inputs': [{'name': '_newOwner', 'type': 'address'}],
+                  'name': 'transferOwnership',
+                  'outputs': [],
+                  'payable': False,
+                  'stateMutability': 'nonpayable',
+                  'type': 'function'},
+                 {'anonymous': False,
+                  'inputs': [{'indexed': True,
+                              'name': 'burner',
+                              'type': 'address'},
+                             {'indexed': False,
+                              'name': 'value',
+                              'type': 'uint256'}],
+                  'name': 'Burn',
+                  'type': 'event'},
+                 {'anonymous': False,
+                  'inputs': [{'indexed': True, 'name': 'to', 'type': 'address'},
+                             {'indexed': False,
+                              'name': 'amount',
+                              'type': 'uint256'}],
+                  'name': 'Mint',
+                  'type': 'event'},
+                 {'anonymous': False,
+                  'inputs': [],
+                  'name': 'MintFinished',
+                  'type': 'event'},
+                 {'anonymous': False,
+                  'inputs': [{'indexed': True,
+                              'name': 'previousOwner',
+                              'type': 'address'}],
+                  'name': 'OwnershipRenounced',
+                  'type': 'event'},
+                 {'anonymous': False,
+                  'inputs': [{'indexed': True,
+                              'name': 'previousOwner',
+                              'type': 'address'},
+                             {'indexed': True,
+                              'name': 'newOwner',
+                              'type': 'address'}],
+                  'name': 'OwnershipTransferred',
+                  'type': 'event'},
+                 {'anonymous': False,
+                  'inputs': [{'indexed': True,
+                              'name': 'owner',
+                              'type': 'address'},
+                             {'indexed': True,
+                              'name': 'spender',
+                              'type': 'address'},
+                             {'indexed': False,
+                              'name': 'value',
+                              'type': 'uint256'}],
+                  'name': 'Approval',
+                  'type': 'event'},
+                 {'anonymous': False,
+                  'inputs': [{'indexed': True,
+                              'name': 'from',
+                              'type': 'address'},
+                             {'indexed': True, 'name': 'to', 'type': 'address'},
+                             {'indexed': False,
+                              'name': 'value',
+                              'type': 'uint256'}],
+                  'name': 'Transfer',
+                  'type': 'event'}],
+ 'liquidator': [{'constant': True,
+                 'inputs': [{'name': '', 'type': 'uint256'}],
+                 'name': 'liquidations',
+                 'outputs': [{'name': 'loanId', 'type': 'uint256'},
+                             {'name': 'collateralAmount', 'type': 'uint256'},
+                             {'name': 'amount', 'type': 'uint256'},
+                             {'name': 'endTime', 'type': 'uint256'},
+                             {'name': 'bestBid', 'type': 'uint256'},
+                             {'name': 'bestBidder', 'type': 'address'},
+                             {'name': 'state', 'type': 'uint8'}],
+                 'payable': False,
+                 'stateMutability': 'view',
+                 'type': 'function'},
+                {'constant': True,
+                 'inputs': [{'name': '', 'type': 'address'}],
+                 'name': 'deposits',
+                 'outputs': [{'name': '', 'type': 'uint256'}],
+                 'payable': False,
+                 'stateMutability': 'view',
+                 'type': 'function'},
+                {'inputs': [{'name': 'tokenAddr', 'type': 'address'},
+                            {'name': 'erc20BankAddr', 'type': 'address'}],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'constructor'},
+                {'anonymous': False,
+                 'inputs': [{'indexed': True,
+                             'name': 'liquidationId',
+                             'type': 'uint256'},
+                            {'indexed': True,
+                             'name': 'loanId',
+                             'type': 'uint256'},
+                            {'indexed': False,
+                             'name': 'collateralAmount',
+                             'type': 'uint256'},
+                            {'indexed': False,
+                             'name': 'amount',
+                             'type': 'uint256'},
+                            {'indexed': False,
+                             'name': 'endTime',
+                             'type': 'uint256'}],
+                 'name': 'LiquidationStarted',
+                 'type': 'event'},
+                {'anonymous': False,
+                 'inputs': [{'indexed': True,
+                             'name': 'liquidationId',
+                             'type': 'uint256'},
+                            {'indexed': True,
+                             'name': 'loanId',
+                             'type': 'uint256'},
+                            {'indexed': False,
+                             'name': 'bestBid',
+                             'type': 'uint256'},
+                            {'indexed': False,
+                             'name': 'bestBidder',
+                             'type': 'address'}],
+                 'name': 'LiquidationStopped',
+                 'type': 'event'},
+                {'anonymous': False,
+                 'inputs': [{'indexed': True,
+                             'name': 'withdrawalAccount',
+                             'type': 'address'},
+                            {'indexed': False,
+                             'name': 'amount',
+                             'type': 'uint256'}],
+                 'name': 'Withdrew',
+                 'type': 'event'},
+                {'constant': False,
+                 'inputs': [],
+                 'name': 'withdraw',
+                 'outputs': [],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [{'name': 'loadId', 'type': 'uint256'},
+                            {'name': 'collateralAmount', 'type': 'uint256'},
+                            {'name': 'amount', 'type': 'uint256'},
+                            {'name': 'duration', 'type': 'uint256'}],
+                 'name': 'startLiquidation',
+                 'outputs': [],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [{'name': 'liquidationId', 'type': 'uint256'}],
+                 'name': 'stopLiquidation',
+                 'outputs': [],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'},
+                {'constant': False,
+                 'inputs': [{'name': 'liquidationId', 'type': 'uint256'},
+                            {'name': 'bidAmount', 'type': 'uint256'}],
+                 'name': 'placeBid',
+                 'outputs': [],
+                 'payable': False,
+                 'stateMutability': 'nonpayable',
+                 'type': 'function'}],
+ 'oracles': [{'constant': False,
+              'inputs': [],
+              'name': 'renounceOwnership',
+              'outputs': [],
+              'payable': False,
+              'stateMutability': 'nonpayable',
+              'type': 'function'},
+             {'constant': True,
+              'inputs': [],
+              'name': 'recruitingFinished',
+              'outputs': [{'name': '', 'type': 'bool'}],
+              'payable': False,
+              'stateMutability': 'view',
+              'type': 'function'},
+             {'constant': True,
+              'inputs': [],
+              'name': 'owner',
+              'outputs': [{'name': '', 'type': 'address'}],
+              'payable': False,
+              'stateMutability': 'view',
+              'type': 'function'},
+             {'constant': False,
+              'inputs': [{'name': '_newOwner', 'type': 'address'}],
+              'name': 'transferOwnership',
+              'outputs': [],
+              'payable': False,
+              'stateMutability': 'nonpayable',
+              'type': 'function'},
+             {'inputs': [{'name': 'erc20BankAddr', 'type': 'address'}],
+              'payable': False,
+              'stateMutability': 'nonpayable',
+              'type': 'constructor'},
+             {'anonymous': False,
+              'inputs': [{'indexed': False,
+                          'name': 'oracle',
+                          'type': 'address'},
+                         {'indexed': False,
+                          'name': 'score',
+                          'type': 'uint256'}],
+              'name': 'EditOracles',
+              'type': 'event'},
+             {'anonymous': False,
+              'inputs': [],
+              'name': 'FinishRecruiting',
+              'type': 'event'},
+             {'anonymous': False,
+              'inputs': [{'indexed': False,
+                          'name': 'oracle',
+                          'type': 'address'},
+                         {'indexed': False, 'name': '_type', 'type': 'uint8'},
+                         {'indexed': False,
+                          'name': '_value',
+                          'type': 'uint256'}],
+              'name': 'SetVote',
+              'type': 'event'},
+             {'anonymous': False,
+              'inputs': [{'indexed': True, 'name': '_type', 'type': 'uint8'},
+                         {'indexed': False,
+                          'name': '_value',
+                          'type': 'uint256'}],
+              'name': 'Update',
+              'type': 'event'},
+             {'anonymous': False,
+              'inputs': [{'indexed': True,
+                          'name': 'previousOwner',
+                          'type': 'address'}],
+              'name': 'OwnershipRenounced',
+              'type': 'event'},
+             {'anonymous': False,
+              'inputs': [{'indexed': True,
+                          'name': 'previousOwner',
+                          'type': 'address'},
+                         {'indexed': True,
+                          'name': 'newOwner',
+                          'type': 'address'}],
+              'name': 'OwnershipTransferred',
+              'type': 'event'},
+             {'constant': False,
+              'inputs': [{'name': '_type', 'type': 'uint8'},
+                         {'name': '_value', 'type': 'uint256'}],
+              'name': 'vote',
+              'outputs': [],
+              'payable': False,
+              'stateMutability': 'nonpayable',
+              'type': 'function'},
+             {'constant': False,
+              'inputs': [{'name': '_account', 'type': 'address'},
+                         {'name': '_score', 'type': 'uint256'}],
+              'name': 'setScore',
+              'outputs': [],
+              'payable': False,
+              'stateMutability': 'nonpayable',
+              'type': 'function'},
+             {'constant': False,
+              'inputs': [],
+              'name': 'finishRecruiting',
+              'outputs': [],
+              'payable': False,
+              'stateMutability': 'nonpayable',
+              'type': 'function'}]}
+
+SELECTORS = {'collateral': {'allowance': '0xdd62ed3e',
+                'approve': '0x095ea7b3',
+                'balanceOf': '0x70a08231',
+                'burn': '0x42966c68',
+                'decimals': '0x313ce567',
+                'decreaseApproval': '0x66188463',
+                'finishMinting': '0x7d64bcb4',
+                'increaseApproval': '0xd73dd623',
+                'mint': '0x40c10f19',
+                'mintingFinished': '0x05d2035b',
+                'name': '0x06fdde03',
+                'owner': '0x8da5cb5b',
+                'renounceOwnership': '0x715018a6',
+                'symbol': '0x95d89b41',
+                'totalSupply': '0x18160ddd',
+                'transfer': '0xa9059cbb',
+                'transferFrom': '0x23b872dd',
+                'transferOwnership': '0xf2fde38b'},
+ 'erc20bank': {'collateralPrice': '0x5891de72',
+               'collateralRatio': '0xb4eae1cb',
+               'decreaseCollateral': '0x52363587',
+               'discharge': '0x5d5e2684',
+               'etherDollarAddr': '0xfbef5d3b',
+               'getLoan': '0x504006ca',
+               'increaseCollateral': '0xb8a83834',
+               'lastLoanId': '0x68be92b4',
+               'liquidate': '0x415f1240',
+               'liquidated': '0xb76f1c4d',
+               'liquidationDuration': '0xb2dec5eb',
+               'liquidatorAddr': '0x6b29b960',
+               'loans': '0xe1ec3c68',
+               'minCollateral': '0x0244d7d8',
+               'oraclesAddr': '0x4e7739bc',
+               'owner': '0x8da5cb5b',
+               'renounceOwnership': '0x715018a6',
+               'setLiquidator': '0x01c76f81',
+               'setOracle': '0x7adbf973',
+               'setVariable': '0x06290684',
+               'settleLoan': '0xe1960743',
+               'transferOwnership': '0xf2fde38b'},
+ 'etherdollar': {'allowance': '0xdd62ed3e',
+                 'approve': '0x095ea7b3',
+                 'balanceOf': '0x70a08231',
+                 'burn': '0x42966c68',
+                 'decimals': '0x313ce567',
+                 'decreaseApproval': '0x66188463',
+                 'finishMinting': '0x7d64bcb4',
+                 'increaseApproval': '0xd73dd623',
+                 'mint': '0x40c10f19',
+                 'mintingFinished': '0x05d2035b',
+                 'name': '0x06fdde03',
+                 'owner': '0x8da5cb5b',
+                 'renounceOwnership': '0x715018a6',
+                 'symbol': '0x95d89b41',
+                 'totalSupply': '0x18160ddd',
+                 'transfer': '0xa9059cbb',
+                 'transferFrom': '0x23b872dd',
+                 'transferOwnership': '0xf2fde38b'},
+ 'liquidator': {'deposits': '0xfc7e286d',
+                'liquidations': '0xa66c84f4',
+                'placeBid': '0x57c90de5',
+                'startLiquidation': '0x8d03ebdd',
+                'stopLiquidation': '0xc30a6fbc',
+                'withdraw': '0x3ccfd60b'},
+ 'oracles': {'finishRecruiting': '0xe84cc6ec',
+             'owner': '0x8da5cb5b',
+             'recruitingFinished': '0x8999fe78',
+             'renounceOwnership': '0x715018a6',
+             'setScore': '0xee0fcc75',
+             'transferOwnership': '0xf2fde38b',
+             'vote': '0xd3f29ace'}}
+
+EVENT_TOPICS = {'collateral': {'Approval': '0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925',
+                'Burn': '0xcc16f5dbb4873280815c1ee09dbd06736cffcc184412cf7a71a0fdb75d397ca5',
+                'Mint': '0x0f6798a560793a54c3bcfe86a93cde1e73087d944c0ea20544137d4121396885',
+                'MintFinished': '0xae5184fba832cb2b1f702aca6117b8d265eaf03ad33eb133f19dde0f5920fa08',
+                'OwnershipRenounced': '0xf8df31144d9c2f0f6b59d69b8b98abd5459d07f2742c4df920b25aae33c64820',
+                'OwnershipTransferred': '0x8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0',
+                'Transfer': '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'},
+ 'erc20bank': {'CollateralDecreased': '0x9b3e5f7b15bb5cc6503cc5e8f99838d7dfbc87dd5fb8d42181dfebb89eb0082e',
+               'CollateralIncreased': '0xcf048c5fe34eacf980171bc5318192b1ca0215a47964babc6a26541aec4b71f4',
+               'Discharged': '0x8418b6df741d7457907280cfa3c6c9a5cc8ba6de649d9a3ffdc7a637a538e18b',
+               'LoanGot': '0xc03ba8103af2cd9023722e1b54eb228ab7f7a23b1b208cc38ff25805712d0a4e',
+               'LoanSettled': '0x04eb628e6b4e486dfec4e7ce8fa93b19892f2a8871fcabc0c3d2cea814e94ec3',
+               'OwnershipRenounced': '0xf8df31144d9c2f0f6b59d69b8b98abd5459d07f2742c4df920b25aae33c64820',
+               'OwnershipTransferred': '0x8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0'},
+ 'etherdollar': {'Approval': '0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925',
+                 'Burn': '0xcc16f5dbb4873280815c1ee09dbd06736cffcc184412cf7a71a0fdb75d397ca5',
+                 'Mint': '0x0f6798a560793a54c3bcfe86a93cde1e73087d944c0ea20544137d4121396885',
+                 'MintFinished': '0xae5184fba832cb2b1f702aca6117b8d265eaf03ad33eb133f19dde0f5920fa08',
+                 'OwnershipRenounced': '0xf8df31144d9c2f0f6b59d69b8b98abd5459d07f2742c4df920b25aae33c64820',
+                 'OwnershipTransferred': '0x8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0',
+                 'Transfer': '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'},
+ 'liquidator': {'LiquidationStarted': '0xc804a4a4efb943e6237d536fd16fbcbb0e4cae16335aebe1178be3cb8e0aa8d3',
+                'LiquidationStopped': '0x64415bf1e95abb8c3c848b4432ca181922dd8ccc51284ebed0cac81fa7eefc69',
+                'Withdrew': '0xb244b9a17ad633c6e83b7983ee04320484956a68ddbe96a0b70dfca1cf19d723'},
+ 'oracles': {'EditOracles': '0xcb319c28e6e6c798fbdaa5ece57ab757530c147028fe5c27d900e9e67056260b',
+             'FinishRecruiting': '0x7386e3fc68e686f8e8655a3b909c15ab407906c8cf90bf4586367420f72f6762',
+             'OwnershipRenounced': '0xf8df31144d9c2f0f6b59d69b8b98abd5459d07f2742c4df920b25aae33c64820',
+             'OwnershipTransferred': '0x8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0',
+             'SetVote': '0x648506c308b5264b467d7c0b30d1ed0c58efeb28f7f8f8ba0e72bbd4e0898a27',
+             'Update': '0x840290db11034b7224de81409dda2837f15473a42c7bfb7db7762f3395a625ab'}}
+
+
+_ERC20BANK_LOANS_SELECTOR = bytes.fromhex('e1ec3c68')
+
+
+def encode_erc20bank_loans(arg0):
+    "loans(uint256)"
+    return _ERC20BANK_LOANS_SELECTOR + arg0.to_bytes(32, 'big')
+
+
+def decode_erc20bank_loans(data):
+    "(address, uint256, uint256, uint8)"
+    return (
+        to_checksum_address(data[12:32]),
+        int.from_bytes(data[32:64], 'big'),
+        int.from_bytes(data[64:96], 'big'),
+        int.from_bytes(data[96:128], 'big'),
+    )
+
+
+_LIQUIDATOR_LIQUIDATIONS_SELECTOR = bytes.fromhex('a66c84f4')
+
+
+def encode_liquidator_liquidations(arg0):
+    "liquidations(uint256)"
+    return _LIQUIDATOR_LIQUIDATIONS_SELECTOR + arg0.to_bytes(32, 'big')
+
+
+def decode_liquidator_liquidations(data):
+    "(uint256, uint256, uint256, uint256, uint256, address, uint8)"
+    return (
+        int.from_bytes(data[0:32], 'big'),
+        int.from_bytes(data[32:64], 'big'),
+        int.from_bytes(data[64:96], 'big'),
+        int.from_bytes(data[96:128], 'big'),
+        int.from_bytes(data[128:160], 'big'),
+        to_checksum_address(data[172:192]),
+        int.from_bytes(data[192:224], 'big'),
+    )
+
+
+def decode_collateral_burn(log):
+    "Burn(address,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'Burn',
+        'args': {
+            'burner': to_checksum_address(topics[1][12:32]),
+            'value': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_collateral_mint(log):
+    "Mint(address,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'Mint',
+        'args': {
+            'to': to_checksum_address(topics[1][12:32]),
+            'amount': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_collateral_mint_finished(log):
+    "MintFinished()"
+    return {
+        'event': 'MintFinished',
+        'args': {
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_collateral_ownership_renounced(log):
+    "OwnershipRenounced(address)"
+    topics = [_bytes(t) for t in log['topics']]
+    return {
+        'event': 'OwnershipRenounced',
+        'args': {
+            'previousOwner': to_checksum_address(topics[1][12:32]),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_collateral_ownership_transferred(log):
+    "OwnershipTransferred(address,address)"
+    topics = [_bytes(t) for t in log['topics']]
+    return {
+        'event': 'OwnershipTransferred',
+        'args': {
+            'previousOwner': to_checksum_address(topics[1][12:32]),
+            'newOwner': to_checksum_address(topics[2][12:32]),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_collateral_approval(log):
+    "Approval(address,address,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'Approval',
+        'args': {
+            'owner': to_checksum_address(topics[1][12:32]),
+            'spender': to_checksum_address(topics[2][12:32]),
+            'value': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_collateral_transfer(log):
+    "Transfer(address,address,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'Transfer',
+        'args': {
+            'from': to_checksum_address(topics[1][12:32]),
+            'to': to_checksum_address(topics[2][12:32]),
+            'value': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_erc20bank_loan_got(log):
+    "LoanGot(address,uint256,uint256,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'LoanGot',
+        'args': {
+            'recipient': to_checksum_address(topics[1][12:32]),
+            'loanId': int.from_bytes(topics[2][0:32], 'big'),
+            'amount': int.from_bytes(data[0:32], 'big'),
+            'collateralAmount': int.from_bytes(data[32:64], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_erc20bank_loan_settled(log):
+    "LoanSettled(address,uint256,uint256,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'LoanSettled',
+        'args': {
+            'recipient': to_checksum_address(data[12:32]),
+            'loanId': int.from_bytes(topics[1][0:32], 'big'),
+            'collateralAmount': int.from_bytes(data[32:64], 'big'),
+            'amount': int.from_bytes(data[64:96], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_erc20bank_collateral_increased(log):
+    "CollateralIncreased(address,uint256,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'CollateralIncreased',
+        'args': {
+            'recipient': to_checksum_address(topics[1][12:32]),
+            'loanId': int.from_bytes(topics[2][0:32], 'big'),
+            'collateralAmount': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_erc20bank_collateral_decreased(log):
+    "CollateralDecreased(address,uint256,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'CollateralDecreased',
+        'args': {
+            'recipient': to_checksum_address(topics[1][12:32]),
+            'loanId': int.from_bytes(topics[2][0:32], 'big'),
+            'collateralAmount': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_erc20bank_discharged(log):
+    "Discharged(uint256)"
+    data = _bytes(log['data'])
+    return {
+        'event': 'Discharged',
+        'args': {
+            'amount': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_erc20bank_ownership_renounced(log):
+    "OwnershipRenounced(address)"
+    topics = [_bytes(t) for t in log['topics']]
+    return {
+        'event': 'OwnershipRenounced',
+        'args': {
+            'previousOwner': to_checksum_address(topics[1][12:32]),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_erc20bank_ownership_transferred(log):
+    "OwnershipTransferred(address,address)"
+    topics = [_bytes(t) for t in log['topics']]
+    return {
+        'event': 'OwnershipTransferred',
+        'args': {
+            'previousOwner': to_checksum_address(topics[1][12:32]),
+            'newOwner': to_checksum_address(topics[2][12:32]),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_etherdollar_burn(log):
+    "Burn(address,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'Burn',
+        'args': {
+            'burner': to_checksum_address(topics[1][12:32]),
+            'value': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_etherdollar_mint(log):
+    "Mint(address,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'Mint',
+        'args': {
+            'to': to_checksum_address(topics[1][12:32]),
+            'amount': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_etherdollar_mint_finished(log):
+    "MintFinished()"
+    return {
+        'event': 'MintFinished',
+        'args': {
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_etherdollar_ownership_renounced(log):
+    "OwnershipRenounced(address)"
+    topics = [_bytes(t) for t in log['topics']]
+    return {
+        'event': 'OwnershipRenounced',
+        'args': {
+            'previousOwner': to_checksum_address(topics[1][12:32]),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_etherdollar_ownership_transferred(log):
+    "OwnershipTransferred(address,address)"
+    topics = [_bytes(t) for t in log['topics']]
+    return {
+        'event': 'OwnershipTransferred',
+        'args': {
+            'previousOwner': to_checksum_address(topics[1][12:32]),
+            'newOwner': to_checksum_address(topics[2][12:32]),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_etherdollar_approval(log):
+    "Approval(address,address,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'Approval',
+        'args': {
+            'owner': to_checksum_address(topics[1][12:32]),
+            'spender': to_checksum_address(topics[2][12:32]),
+            'value': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_etherdollar_transfer(log):
+    "Transfer(address,address,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'Transfer',
+        'args': {
+            'from': to_checksum_address(topics[1][12:32]),
+            'to': to_checksum_address(topics[2][12:32]),
+            'value': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_liquidator_liquidation_started(log):
+    "LiquidationStarted(uint256,uint256,uint256,uint256,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'LiquidationStarted',
+        'args': {
+            'liquidationId': int.from_bytes(topics[1][0:32], 'big'),
+            'loanId': int.from_bytes(topics[2][0:32], 'big'),
+            'collateralAmount': int.from_bytes(data[0:32], 'big'),
+            'amount': int.from_bytes(data[32:64], 'big'),
+            'endTime': int.from_bytes(data[64:96], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_liquidator_liquidation_stopped(log):
+    "LiquidationStopped(uint256,uint256,uint256,address)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'LiquidationStopped',
+        'args': {
+            'liquidationId': int.from_bytes(topics[1][0:32], 'big'),
+            'loanId': int.from_bytes(topics[2][0:32], 'big'),
+            'bestBid': int.from_bytes(data[0:32], 'big'),
+            'bestBidder': to_checksum_address(data[44:64]),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_liquidator_withdrew(log):
+    "Withdrew(address,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'Withdrew',
+        'args': {
+            'withdrawalAccount': to_checksum_address(topics[1][12:32]),
+            'amount': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_oracles_edit_oracles(log):
+    "EditOracles(address,uint256)"
+    data = _bytes(log['data'])
+    return {
+        'event': 'EditOracles',
+        'args': {
+            'oracle': to_checksum_address(data[12:32]),
+            'score': int.from_bytes(data[32:64], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_oracles_finish_recruiting(log):
+    "FinishRecruiting()"
+    return {
+        'event': 'FinishRecruiting',
+        'args': {
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_oracles_set_vote(log):
+    "SetVote(address,uint8,uint256)"
+    data = _bytes(log['data'])
+    return {
+        'event': 'SetVote',
+        'args': {
+            'oracle': to_checksum_address(data[12:32]),
+            '_type': int.from_bytes(data[32:64], 'big'),
+            '_value': int.from_bytes(data[64:96], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_oracles_update(log):
+    "Update(uint8,uint256)"
+    topics = [_bytes(t) for t in log['topics']]
+    data = _bytes(log['data'])
+    return {
+        'event': 'Update',
+        'args': {
+            '_type': int.from_bytes(topics[1][0:32], 'big'),
+            '_value': int.from_bytes(data[0:32], 'big'),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_oracles_ownership_renounced(log):
+    "OwnershipRenounced(address)"
+    topics = [_bytes(t) for t in log['topics']]
+    return {
+        'event': 'OwnershipRenounced',
+        'args': {
+            'previousOwner': to_checksum_address(topics[1][12:32]),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+def decode_oracles_ownership_transferred(log):
+    "OwnershipTransferred(address,address)"
+    topics = [_bytes(t) for t in log['topics']]
+    return {
+        'event': 'OwnershipTransferred',
+        'args': {
+            'previousOwner': to_checksum_address(topics[1][12:32]),
+            'newOwner': to_checksum_address(topics[2][12:32]),
+        },
+        'blockNumber': log['blockNumber'],
+        'logIndex': log['logIndex'],
+        'transactionHash': log['transactionHash'],
+    }
+
+
+# contract -> topic -> fixed layout event decoder
+EVENT_DECODERS = {
+    'collateral': {
+        '0xcc16f5dbb4873280815c1ee09dbd06736cffcc184412cf7a71a0fdb75d397ca5': decode_collateral_burn,
+        '0x0f6798a560793a54c3bcfe86a93cde1e73087d944c0ea20544137d4121396885': decode_collateral_mint,
+        '0xae5184fba832cb2b1f702aca6117b8d265eaf03ad33eb133f19dde0f5920fa08': decode_collateral_mint_finished,
+        '0xf8df31144d9c2f0f6b59d69b8b98abd5459d07f2742c4df920b25aae33c64820': decode_collateral_ownership_renounced,
+        '0x8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0': decode_collateral_ownership_transferred,
+        '0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925': decode_collateral_approval,
+        '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef': decode_collateral_transfer,
+    },
+    'erc20bank': {
+        '0xc03ba8103af2cd9023722e1b54eb228ab7f7a23b1b208cc38ff25805712d0a4e': decode_erc20bank_loan_got,
+        '0x04eb628e6b4e486dfec4e7ce8fa93b19892f2a8871fcabc0c3d2cea814e94ec3': decode_erc20bank_loan_settled,
+        '0xcf048c5fe34eacf980171bc5318192b1ca0215a47964babc6a26541aec4b71f4': decode_erc20bank_collateral_increased,
+        '0x9b3e5f7b15bb5cc6503cc5e8f99838d7dfbc87dd5fb8d42181dfebb89eb0082e': decode_erc20bank_collateral_decreased,
+        '0x8418b6df741d7457907280cfa3c6c9a5cc8ba6de649d9a3ffdc7a637a538e18b': decode_erc20bank_discharged,
+        '0xf8df31144d9c2f0f6b59d69b8b98abd5459d07f2742c4df920b25aae33c64820': decode_erc20bank_ownership_renounced,
+        '0x8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0': decode_erc20bank_ownership_transferred,
+    },
+    'etherdollar': {
+        '0xcc16f5dbb4873280815c1ee09dbd06736cffcc184412cf7a71a0fdb75d397ca5': decode_etherdollar_burn,
+        '0x0f6798a560793a54c3bcfe86a93cde1e73087d944c0ea20544137d4121396885': decode_etherdollar_mint,
+        '0xae5184fba832cb2b1f702aca6117b8d265eaf03ad33eb133f19dde0f5920fa08': decode_etherdollar_mint_finished,
+        '0xf8df31144d9c2f0f6b59d69b8b98abd5459d07f2742c4df920b25aae33c64820': decode_etherdollar_ownership_renounced,
+        '0x8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0': decode_etherdollar_ownership_transferred,
+        '0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925': decode_etherdollar_approval,
+        '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef': decode_etherdollar_transfer,
+    },
+    'liquidator': {
+        '0xc804a4a4efb943e6237d536fd16fbcbb0e4cae16335aebe1178be3cb8e0aa8d3': decode_liquidator_liquidation_started,
+        '0x64415bf1e95abb8c3c848b4432ca181922dd8ccc51284ebed0cac81fa7eefc69': decode_liquidator_liquidation_stopped,
+        '0xb244b9a17ad633c6e83b7983ee04320484956a68ddbe96a0b70dfca1cf19d723': decode_liquidator_withdrew,
+    },
+    'oracles': {
+        '0xcb319c28e6e6c798fbdaa5ece57ab757530c147028fe5c27d900e9e67056260b': decode_oracles_edit_oracles,
+        '0x7386e3fc68e686f8e8655a3b909c15ab407906c8cf90bf4586367420f72f6762': decode_oracles_finish_recruiting,
+        '0x648506c308b5264b467d7c0b30d1ed0c58efeb28f7f8f8ba0e72bbd4e0898a27': decode_oracles_set_vote,
+        '0x840290db11034b7224de81409dda2837f15473a42c7bfb7db7762f3395a625ab': decode_oracles_update,
+        '0xf8df31144d9c2f0f6b59d69b8b98abd5459d07f2742c4df920b25aae33c64820': decode_oracles_ownership_renounced,
+        '0x8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0': decode_oracles_ownership_transferred,
+    },
+}
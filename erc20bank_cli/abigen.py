@@ -0,0 +1,201 @@
+"""Generate erc20bank_cli/abi.py from config.ABIES
+
+Run `python -m erc20bank_cli.abigen` after editing the ABIs in config.py.
+The generated module holds the ABIs as python literals, the selectors and
+event topics of every contract, fixed layout codecs for the struct getters
+that the list commands call once per loan or liquidation, and fixed layout
+decoders for every event whose parameters are all static."""
+import os
+import re
+import json
+import pprint
+from eth_utils import keccak
+from . import config
+
+# (contract, function) pairs which get their own encoder and decoder
+HOT_GETTERS = [('erc20bank', 'loans'), ('liquidator', 'liquidations')]
+
+OUTPUT = os.path.join(os.path.dirname(__file__), 'abi.py')
+
+HEADER = '''"""ABIs, selectors and fixed layout codecs of the ERC20Bank contracts
+
+Generated by erc20bank_cli/abigen.py from config.ABIES, do not edit."""
+from eth_utils import to_checksum_address
+
+
+def _bytes(value):
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:])
+    return bytes(value)
+
+'''
+
+# decoders of the static types, by 32 bytes word of buf
+WORD_DECODERS = {
+    'address': 'to_checksum_address({buf}[{address}:{end}])',
+    'bool': "{buf}[{start}:{end}] != b'\\0' * 32",
+}
+
+
+def signature(item):
+    return '{}({})'.format(item['name'],
+                           ','.join(i['type'] for i in item['inputs']))
+
+
+def selectors(abi):
+    return {
+        item['name']: '0x' + keccak(text=signature(item))[:4].hex()
+        for item in abi if item['type'] == 'function' and 'name' in item
+    }
+
+
+def topics(abi):
+    return {
+        item['name']: '0x' + keccak(text=signature(item)).hex()
+        for item in abi if item['type'] == 'event'
+    }
+
+
+def word_decoder(abi_type, i, buf='data'):
+    start, end = i * 32, (i + 1) * 32
+    if abi_type in WORD_DECODERS:
+        return WORD_DECODERS[abi_type].format(
+            buf=buf, start=start, address=start + 12, end=end)
+    if abi_type.startswith('uint'):
+        return "int.from_bytes({}[{}:{}], 'big')".format(buf, start, end)
+    if abi_type.startswith('int'):
+        return "int.from_bytes({}[{}:{}], 'big', signed=True)".format(
+            buf, start, end)
+    raise ValueError('{} is not a fixed size type'.format(abi_type))
+
+
+def snake(name):
+    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+
+
+def event_decoder(contract, item):
+    "The decoder function of an event, it raises ValueError on dynamic types"
+
+    name = 'decode_{}_{}'.format(contract, snake(item['name']))
+    args = []
+    topic = 1
+    word = 0
+    for i in item['inputs']:
+        if i.get('indexed'):
+            args.append((i['name'],
+                         word_decoder(i['type'], 0,
+                                      'topics[{}]'.format(topic))))
+            topic += 1
+        else:
+            args.append((i['name'], word_decoder(i['type'], word)))
+            word += 1
+    lines = [
+        '',
+        '',
+        'def {}(log):'.format(name),
+        '    "{}"'.format(signature(item)),
+    ]
+    if topic > 1:
+        lines.append("    topics = [_bytes(t) for t in log['topics']]")
+    if word:
+        lines.append("    data = _bytes(log['data'])")
+    lines += [
+        '    return {',
+        "        'event': {!r},".format(item['name']),
+        "        'args': {",
+    ]
+    lines += ['            {!r}: {},'.format(n, e) for n, e in args]
+    lines += [
+        '        },',
+        "        'blockNumber': log['blockNumber'],",
+        "        'logIndex': log['logIndex'],",
+        "        'transactionHash': log['transactionHash'],",
+        '    }',
+    ]
+    return name, lines
+
+
+def getter_codecs(contract, item):
+    name = '{}_{}'.format(contract, item['name'])
+    types = [o['type'] for o in item['outputs']]
+    args = ['arg{}'.format(i) for i in range(len(item['inputs']))]
+    for i in item['inputs']:
+        if not i['type'].startswith('uint'):
+            raise ValueError('{} has a non uint input'.format(name))
+    selector = '0x' + keccak(text=signature(item))[:4].hex()
+    lines = [
+        '',
+        '',
+        '_{}_SELECTOR = bytes.fromhex({!r})'.format(name.upper(),
+                                                    selector[2:]),
+        '',
+        '',
+        'def encode_{}({}):'.format(name, ', '.join(args)),
+        '    "{}"'.format(signature(item)),
+        '    return _{}_SELECTOR{}'.format(
+            name.upper(), ''.join(
+                " + {}.to_bytes(32, 'big')".format(arg) for arg in args)),
+        '',
+        '',
+        'def decode_{}(data):'.format(name),
+        '    "({})"'.format(', '.join(types)),
+        '    return (',
+    ]
+    lines += [
+        '        {},'.format(word_decoder(t, i)) for i, t in enumerate(types)
+    ]
+    lines.append('    )')
+    return lines
+
+
+def generate():
+    abies = {name: json.loads(abi) for name, abi in config.ABIES.items()}
+    lines = [HEADER]
+    lines.append('ABIES = {}'.format(pprint.pformat(abies)))
+    lines.append('')
+    lines.append('SELECTORS = {}'.format(
+        pprint.pformat({name: selectors(abi)
+                        for name, abi in abies.items()})))
+    lines.append('')
+    lines.append('EVENT_TOPICS = {}'.format(
+        pprint.pformat({name: topics(abi)
+                        for name, abi in abies.items()})))
+    for contract, function in HOT_GETTERS:
+        item = [
+            item for item in abies[contract]
+            if item['type'] == 'function' and item['name'] == function
+        ][0]
+        lines += getter_codecs(contract, item)
+    decoders = {}
+    for contract in sorted(abies):
+        for item in abies[contract]:
+            if item['type'] != 'event' or item.get('anonymous'):
+                continue
+            try:
+                name, decoder = event_decoder(contract, item)
+            except ValueError:
+                continue
+            lines += decoder
+            decoders.setdefault(contract, []).append(
+                (topics([item])[item['name']], name))
+    lines += ['', '', '# contract -> topic -> fixed layout event decoder',
+              'EVENT_DECODERS = {']
+    for contract in sorted(decoders):
+        lines.append('    {!r}: {{'.format(contract))
+        lines += [
+            '        {!r}: {},'.format(topic, name)
+            for topic, name in decoders[contract]
+        ]
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    with open(OUTPUT, 'w') as f:
+        f.write(generate())
+    print('Wrote {}'.format(OUTPUT))
+
+
+if __name__ == '__main__':
+    main()
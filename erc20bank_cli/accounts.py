@@ -0,0 +1,74 @@
+import os
+import json
+import functools
+import click
+from eth_account import Account as EthAccount
+from eth_keys import keys
+
+KEYSTORE_DIR = os.path.expanduser('~/.erc20bank/keystore')
+
+# keystore path -> unlocked account, so each keystore is decrypted and its
+# password asked once per process
+_unlocked = {}
+
+
+class Account(object):
+    "An ethereum account with its signing key and address derived once"
+
+    def __init__(self, private_key):
+        if private_key.startswith('0x'):
+            private_key = private_key[2:]
+        self.private_key = private_key
+        self.key = keys.PrivateKey(bytes.fromhex(private_key))
+        self.address = self.key.public_key.to_checksum_address()
+
+    def sign_transaction(self, transaction):
+        return EthAccount.signTransaction(transaction, self.key)
+
+
+@functools.lru_cache(maxsize=None)
+def from_private_key(private_key):
+    if private_key.startswith('0x'):
+        private_key = private_key[2:]
+    return Account(private_key)
+
+
+def from_keystore(path, password):
+    path = os.path.expanduser(path)
+    if path not in _unlocked:
+        with open(path, 'r') as f:
+            keyfile = json.load(f)
+        private_key = EthAccount.decrypt(keyfile, password)
+        _unlocked[path] = from_private_key(bytes(private_key).hex())
+    return _unlocked[path]
+
+
+def keystore_path(name):
+    return os.path.join(KEYSTORE_DIR, '{}.json'.format(name))
+
+
+def named(name, password=None):
+    path = keystore_path(name)
+    if path in _unlocked:
+        return _unlocked[path]
+    if not os.path.exists(path):
+        click.secho('There is no account named {}.'.format(name), fg='red')
+        click.secho()
+        raise SystemExit()
+    if password is None:
+        password = os.environ.get('ERC20BANK_PASSWORD')
+    if password is None:
+        password = click.prompt(
+            'Password for {}'.format(name), hide_input=True)
+    return from_keystore(path, password)
+
+
+def configured():
+    return ('ERC20BANK_PRIVATEKEY' in os.environ
+            or 'ERC20BANK_ACCOUNT' in os.environ)
+
+
+def default():
+    if 'ERC20BANK_PRIVATEKEY' in os.environ:
+        return from_private_key(os.environ['ERC20BANK_PRIVATEKEY'])
+    return named(os.environ['ERC20BANK_ACCOUNT'])
@@ -1,5 +1,12 @@
 import sys
 import click
+from . import abi
+from . import guard as _guard
+from . import keeper as _keeper
+from . import metrics as _metrics
+from . import state as _state
+from . import stress as _stress
+from . import tokens
 from . import utils
 
 
@@ -219,16 +226,56 @@ def get_balance():
     click.secho()
 
 
+@main.command()
+@click.option(
+    '--address',
+    multiple=True,
+    help="The account's address, can be repeated")
+@click.option(
+    '--token',
+    type=click.Choice(tokens.TOKENS),
+    default='etherdollar',
+    help='The token to check')
+@click.option(
+    '--index',
+    is_flag=True,
+    help='Use the local Transfer event index instead of eth_call')
+def balances(address, token, index):
+    "Get the token balances of many accounts at once"
+
+    if index:
+        result = tokens.indexed_balances(token, address or None)
+    elif not address:
+        click.secho('Error: --address is required without --index', fg='red')
+        click.secho()
+        sys.exit()
+    else:
+        result = tokens.balances(token, address)
+    for owner, balance in sorted(result.items()):
+        click.secho(
+            '{0}:\t{1}'.format(owner, round(balance * 10**-18, 10)),
+            fg='green')
+    if not result:
+        click.secho('There is no balance.', fg='green')
+    click.secho()
+
+
 @main.command()
 @click.option('--owner', required=True, help="The account's address")
 @click.option('--spender', required=True, help="The account's address")
-def allowance(owner, spender):
+@click.option(
+    '--index',
+    is_flag=True,
+    help='Use the local Approval event index, the last approved value')
+def allowance(owner, spender, index):
     "Get Ether dollar account's balance"
 
-    owner = utils.w3.toChecksumAddress(owner)
-    spender = utils.w3.toChecksumAddress(spender)
-    func = utils.contracts['etherdollar'].functions.allowance(owner, spender)
-    result = utils.send_eth_call(func, spender)
+    if index:
+        result = list(
+            tokens.indexed_allowances('etherdollar',
+                                      [(owner, spender)]).values())[0]
+    else:
+        result = tokens.allowance('etherdollar', owner, spender)
     click.secho('Allowance: {} dollar'.format(result / 10.0**18), fg='green')
     click.secho()
     return result
@@ -277,16 +324,20 @@ def loans_list():
 
 
 @main.command()
-def liquidatable_loans():
+@click.option(
+    '--deployments',
+    callback=utils.check_deployments,
+    help='Comma separated deployments to query concurrently')
+def liquidatable_loans(deployments):
     "Get list of liquidatable loans"
 
     result = []
-    var = _get_variables()
-    res = _loans_list()
-    for loan in sorted(res, key=lambda loan: loan['loanId']):
-        if loan['state'] == 'active' and loan['collateral'] * 10**-18 * var[
-                'collateralPrice'] * 10.0**18 < var['collateralRatio'] * loan['amount']:
+    for name, loans in utils.for_deployments(deployments,
+                                             _liquidatable_loans):
+        for loan in loans:
             result.append(loan)
+            if deployments:
+                click.secho('deployment:\t{}'.format(name), fg='green')
             click.secho('loanId:\t\t{}'.format(loan['loanId']), fg='green')
             click.secho(
                 'collateral:\t{}'.format(
@@ -319,59 +370,244 @@ def get_variables():
     click.secho()
 
 
-def _loans_list(account=None):
+@main.command()
+@click.option(
+    '--price-path',
+    type=click.Path(exists=True, dir_okay=False),
+    required=True,
+    help='File with one collateral price (or change like -30%) per line')
+@click.option(
+    '--step-minutes',
+    type=float,
+    default=1.0,
+    callback=utils.check_minutes,
+    help='Minutes between two prices of the path')
+@click.option(
+    '--all-steps', is_flag=True, help='Also show the steps without changes')
+def stress(price_path, step_minutes, all_steps):
+    "Simulate the liquidations caused by a collateral price path"
+
+    var = _get_variables()
+    prices = _stress.read_price_path(price_path, var['collateralPrice'])
+    loans = _loans_list()
+    result = None
+    for result in _stress.simulate(loans, var, prices, step_minutes):
+        if not (all_steps or result['liquidated']
+                or result['settledCollateral']):
+            continue
+        click.secho(
+            'step {0}:\t{1} ether dollar'.format(result['step'],
+                                                 round(result['price'], 4)),
+            fg='green' if not result['liquidated'] else 'red')
+        click.secho(
+            'liquidated:\t{0} loans, {1} ether, {2} dollar'.format(
+                result['liquidated'], round(result['collateral'] * 10**-18,
+                                            10),
+                round(result['amount'] * 10**-18, 10)),
+            fg='green')
+        click.secho(
+            'settled:\t{0} ether, {1} dollar'.format(
+                round(result['settledCollateral'] * 10**-18, 10),
+                round(result['settledAmount'] * 10**-18, 10)),
+            fg='green')
+        click.secho(
+            'underAuction:\t{0} ether, {1} dollar'.format(
+                round(result['auctionCollateral'] * 10**-18, 10),
+                round(result['auctionAmount'] * 10**-18, 10)),
+            fg='green')
+        click.secho()
+    if result is None:
+        click.secho('The price path is empty.', fg='red')
+        click.secho()
+        return
+    click.secho(
+        'total:\t\t{0} loans, {1} ether, {2} dollar liquidated'.format(
+            result['totalLoans'], round(result['totalCollateral'] * 10**-18,
+                                        10),
+            round(result['totalAmount'] * 10**-18, 10)),
+        fg='green')
+    click.secho('remaining:\t{} active loans'.format(result['remaining']),
+                fg='green')
+    click.secho()
+
+
+@main.command()
+@click.option('--host', default='127.0.0.1', help='The address to listen on')
+@click.option('--port', type=int, default=9101, help='The port to listen on')
+@click.option(
+    '--interval', type=float, default=15, help='Seconds between event polls')
+def metrics(host, port, interval):
+    "Serve the bank's metrics in Prometheus format"
+
+    bank = _state.BankState(_get_variables())
+    bank.sync(utils.default_deployment)
+    click.secho(
+        'Serving metrics of {0} loans on http://{1}:{2}/metrics'.format(
+            len(bank.loans), host, port),
+        fg='green')
+    exporter = _metrics.Exporter(bank, utils.default_deployment, interval)
+    exporter.serve(host, port)
+
+
+@main.command()
+@click.option(
+    '--buffer',
+    type=float,
+    default=0.1,
+    help='Top up below collateralRatio * (1 + buffer)')
+@click.option(
+    '--target',
+    type=float,
+    default=0.25,
+    help='Top up to collateralRatio * (1 + target)')
+@click.option(
+    '--max-top-ups',
+    type=int,
+    default=5,
+    help='Maximum number of top-ups in each window')
+@click.option(
+    '--window',
+    type=float,
+    default=3600,
+    help='The rate limit window in seconds')
+@click.option(
+    '--cooldown',
+    type=float,
+    default=300,
+    help='Seconds between two top-ups of the same loan')
+@click.option(
+    '--interval', type=float, default=5, help='Seconds between event polls')
+@click.option(
+    '--timeout',
+    type=float,
+    default=300,
+    help='Seconds to wait for a transaction to be mined before replacing it')
+@click.option(
+    '--dry-run', is_flag=True, help='Show the top-ups without sending them')
+@click.option(
+    '--private-key',
+    callback=utils.check_account,
+    help='The privat key to sign the transactions')
+def guard(buffer, target, max_top_ups, window, cooldown, interval, timeout,
+          dry_run, private_key):
+    "Increase the collateral of your loans before they become liquidatable"
+
+    if target <= buffer:
+        click.secho('Error: target must be greater than buffer', fg='red')
+        click.secho()
+        sys.exit()
+    bank = _state.BankState(_get_variables())
+    watcher = _guard.Guard(bank, private_key, buffer, target, max_top_ups,
+                           window, cooldown, timeout, dry_run)
+    bank.sync(utils.default_deployment)
+    loans = [
+        loan for loan in bank.loans.values()
+        if loan['recipient'] == watcher.owner and loan['state'] == 'active'
+    ]
+    click.secho('Guarding {} loans'.format(len(loans)), fg='green')
+    watcher.run(interval)
+
+
+@main.command()
+@click.option(
+    '--interval', type=float, default=5, help='Seconds between event polls')
+@click.option(
+    '--margin',
+    type=int,
+    default=15,
+    help='Seconds to wait after endTime before stopping a liquidation')
+@click.option(
+    '--timeout',
+    type=float,
+    default=300,
+    help='Seconds to wait for a transaction to be mined before replacing it')
+@click.option(
+    '--dry-run', is_flag=True, help='Show the transactions without sending')
+@click.option(
+    '--private-key',
+    callback=utils.check_account,
+    help='The privat key to sign the transactions')
+def keeper(interval, margin, timeout, dry_run, private_key):
+    "Stop finished liquidations and liquidate loans as soon as possible"
+
+    bank = _state.BankState(_get_variables())
+    watcher = _keeper.Keeper(bank, private_key, margin, timeout, dry_run)
+    bank.sync(utils.default_deployment)
+    click.secho(
+        'Watching {0} loans and {1} liquidations'.format(
+            len(bank.loans), len(bank.liquidations)),
+        fg='green')
+    watcher.run(interval)
+
+
+def _liquidatable_loans(deployment=None):
+    result = []
+    var = _get_variables(deployment)
+    res = _loans_list(deployment=deployment)
+    for loan in sorted(res, key=lambda loan: loan['loanId']):
+        if loan['state'] == 'active' and loan['collateral'] * 10**-18 * var[
+                'collateralPrice'] * 10.0**18 < var['collateralRatio'] * loan['amount']:
+            result.append(loan)
+    return result
+
+
+def _loans_list(account=None, deployment=None):
+    d = deployment or utils.default_deployment
     result = {}
     if account:
         filters = {'recipient': account}
     else:
         filters = None
-    loan_filter = utils.contracts['erc20bank'].events.LoanGot.createFilter(
+    loan_filter = d.contracts['erc20bank'].events.LoanGot.createFilter(
         fromBlock=1, toBlock='latest', argument_filters=filters)
-    loans = utils.w3.eth.getLogs(loan_filter.filter_params)
+    loans = d.w3.eth.getLogs(loan_filter.filter_params)
     for loan_bytes in loans:
         loan = loan_filter.format_entry(loan_bytes)
         loan_id = loan['args']['loanId']
-        result[loan_id] = _show(loan_id)
+        result[loan_id] = _show(loan_id, d)
 
     return list(result.values())
 
 
-def _show(loan_id):
+def _show(loan_id, deployment=None):
     loan_params = ['recipient', 'collateral', 'amount', 'state']
     loan_satates = ['active', 'under liquidation', 'liquidated', 'settled']
-    loan = dict(
-        zip(
-            loan_params,
-            utils.send_eth_call(
-                utils.contracts['erc20bank'].functions.loans(loan_id), None)))
+    d = deployment or utils.default_deployment
+    if d.generated('erc20bank'):
+        values = abi.decode_erc20bank_loans(
+            utils.send_raw_call('erc20bank',
+                                abi.encode_erc20bank_loans(loan_id), None,
+                                d))
+    else:
+        values = utils.send_eth_call(
+            d.contracts['erc20bank'].functions.loans(loan_id), None)
+    loan = dict(zip(loan_params, values))
     loan['state'] = loan_satates[loan['state']]
     loan['loanId'] = loan_id
     return loan
 
 
-def _get_variables():
+def _get_variables(deployment=None):
+    contracts = (deployment or utils.default_deployment).contracts
     result = {
         'collateralRatio':
         utils.send_eth_call(
-            utils.contracts['erc20bank'].functions.collateralRatio(),
+            contracts['erc20bank'].functions.collateralRatio(),
             None) / 1000.0,
         'collateralPrice':
         utils.send_eth_call(
-            utils.contracts['erc20bank'].functions.collateralPrice(),
+            contracts['erc20bank'].functions.collateralPrice(),
             None) / 10.0**18,
         'liquidationDuration':
         utils.send_eth_call(
-            utils.contracts['erc20bank'].functions.liquidationDuration(),
+            contracts['erc20bank'].functions.liquidationDuration(),
             None) / 60.0
     }
     return (result)
 
 
 def _get_balance(account):
-    account = utils.w3.toChecksumAddress(account)
-    func = utils.contracts['etherdollar'].functions.balanceOf(account)
-    result = utils.send_eth_call(func, account)
-    return result
+    return tokens.balance_of('etherdollar', account)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,147 @@
+import time
+import collections
+import click
+from . import tokens
+from . import transactions
+from . import utils
+
+
+class Guard(object):
+    """Top up the collateral of our loans before they become liquidatable
+
+    A loan is topped up when its ratio falls below collateralRatio *
+    (1 + buffer), with enough collateral to bring it back to
+    collateralRatio * (1 + target). increaseCollateral pulls the whole
+    allowance, so each top-up approves exactly its collateral and sends
+    increaseCollateral with the next nonce, without waiting for the
+    approve to be mined. A loan stays pending while it needs collateral,
+    so a rate limited loan is looked at again every poll, and it is queued
+    again when either transaction of its top-up fails."""
+
+    def __init__(self, bank, private_key, buffer, target, max_top_ups,
+                 window, cooldown, timeout, dry_run):
+        self.bank = bank
+        self.sender = transactions.Sender(private_key, timeout)
+        self.owner = self.sender.owner
+        self.buffer = buffer
+        self.target = target
+        self.max_top_ups = max_top_ups
+        self.window = window
+        self.cooldown = cooldown
+        self.dry_run = dry_run
+        self.top_ups = collections.deque()
+        self.last_top_up = {}
+        self.pending = set()
+        self.limited = set()
+        # loan id -> keys of its top-up transactions not mined yet
+        self.in_flight = {}
+        bank.listeners.append(self.on_change)
+
+    def on_change(self, kind, item):
+        if kind == 'loan':
+            self.pending.add(item['loanId'])
+        elif kind == 'variables':
+            self.pending.update(loan_id
+                                for loan_id, loan in self.bank.loans.items()
+                                if loan['recipient'] == self.owner)
+
+    def needed(self, loan):
+        "The collateral which brings the loan back to the target ratio"
+
+        variables = self.bank.variables
+        if loan['state'] != 'active' or loan['recipient'] != self.owner:
+            return 0
+        if loan['ratio'] >= variables['collateralRatio'] * (1 + self.buffer):
+            return 0
+        target = variables['collateralRatio'] * (1 + self.target)
+        return int(target * loan['amount'] / variables['collateralPrice'] -
+                   loan['collateral']) + 1
+
+    def allowed(self, loan_id, now):
+        while self.top_ups and self.top_ups[0] <= now - self.window:
+            self.top_ups.popleft()
+        if len(self.top_ups) >= self.max_top_ups:
+            return False
+        return now - self.last_top_up.get(loan_id, 0) >= self.cooldown
+
+    def act(self):
+        now = time.time()
+        for loan_id in sorted(self.pending):
+            if loan_id in self.in_flight:
+                continue
+            loan = self.bank.loans[loan_id]
+            collateral = self.needed(loan)
+            if collateral <= 0:
+                self.pending.discard(loan_id)
+                self.limited.discard(loan_id)
+                continue
+            if not self.allowed(loan_id, now):
+                if loan_id not in self.limited:
+                    click.secho(
+                        'Loan {} needs {} ether, rate limited'.format(
+                            loan_id, round(collateral * 10**-18, 10)),
+                        fg='red')
+                    self.limited.add(loan_id)
+                continue
+            if not self.top_up(loan, collateral):
+                continue
+            self.pending.discard(loan_id)
+            self.limited.discard(loan_id)
+            self.top_ups.append(now)
+            self.last_top_up[loan_id] = now
+
+    def top_up(self, loan, collateral):
+        "Send the approve and increaseCollateral pair, return if it was sent"
+
+        message = 'Loan {0} ratio {1}: adding {2} ether'.format(
+            loan['loanId'], round(loan['ratio'], 4),
+            round(collateral * 10**-18, 10))
+        if self.dry_run:
+            click.secho(message + ' (dry run)', fg='green')
+            return True
+        keys = [('approve', loan['loanId']),
+                ('increaseCollateral', loan['loanId'])]
+        funcs = [
+            utils.contracts['collateral'].functions.approve(
+                utils.addresses['erc20bank'], collateral),
+            utils.contracts['erc20bank'].functions.increaseCollateral(
+                loan['loanId'])
+        ]
+        for key, func in zip(keys, funcs):
+            try:
+                tx_hash = self.sender.send(key, func)
+            except Exception as e:
+                click.secho(message + ' failed: {}'.format(e), fg='red')
+                return False
+            self.in_flight.setdefault(loan['loanId'], set()).add(key)
+            if key[0] == 'approve':
+                tokens.invalidate('collateral')
+        click.secho(message + '\ttx: {}'.format(tx_hash), fg='green')
+        return True
+
+    def check_receipts(self):
+        for key, status in self.sender.poll().items():
+            loan_id = key[1]
+            keys = self.in_flight.get(loan_id, set())
+            keys.discard(key)
+            if not keys:
+                self.in_flight.pop(loan_id, None)
+            if status:
+                continue
+            click.secho(
+                'Loan {} top-up {} {}, queued again'.format(
+                    loan_id, key[0],
+                    'reverted' if status is False else 'was dropped'),
+                fg='red')
+            self.last_top_up.pop(loan_id, None)
+            self.pending.add(loan_id)
+
+    def run(self, interval):
+        while True:
+            try:
+                self.bank.sync(utils.default_deployment)
+                self.act()
+                self.check_receipts()
+            except Exception as e:
+                click.secho('Guard error: {}'.format(e), fg='red')
+            time.sleep(interval)
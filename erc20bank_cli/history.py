@@ -0,0 +1,192 @@
+import os
+import json
+import bisect
+from . import utils
+
+# every table is stored column-wise: one list per field
+COLUMNS = {
+    'started': [
+        'liquidationId', 'loanId', 'collateral', 'amount', 'endTime',
+        'block', 'timestamp'
+    ],
+    'stopped':
+    ['liquidationId', 'loanId', 'bestBid', 'bestBidder', 'block', 'timestamp'],
+    'withdrew': ['account', 'amount', 'block'],
+    'prices': ['price', 'block'],
+}
+
+
+def empty():
+    store = {
+        table: {column: []
+                for column in columns}
+        for table, columns in COLUMNS.items()
+    }
+    store['lastBlock'] = 0
+    return store
+
+
+def _path():
+    return utils.default_deployment.cache_path('history')
+
+
+def load():
+    path = _path()
+    if not os.path.exists(path):
+        return empty()
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save(store):
+    path = _path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w') as f:
+        f.write(json.dumps(store))
+    os.replace(path + '.tmp', path)
+
+
+def _events(event, from_block, to_block, filters=None):
+    event_filter = event.createFilter(
+        fromBlock=from_block, toBlock=to_block, argument_filters=filters)
+    for log in utils.w3.eth.getLogs(event_filter.filter_params):
+        yield event_filter.format_entry(log)
+
+
+def _append(store, table, row):
+    for column, value in zip(COLUMNS[table], row):
+        store[table][column].append(value)
+
+
+def sync(store):
+    "Ingest the liquidator and price events mined since the last sync"
+
+    from_block = store['lastBlock'] + 1
+    to_block = utils.w3.eth.blockNumber
+    if from_block > to_block:
+        return 0
+    timestamps = {}
+
+    def timestamp(block):
+        if block not in timestamps:
+            timestamps[block] = utils.w3.eth.getBlock(block)['timestamp']
+        return timestamps[block]
+
+    events = utils.contracts['liquidator'].events
+    count = 0
+    for e in _events(events.LiquidationStarted, from_block, to_block):
+        args = e['args']
+        _append(store, 'started', [
+            args['liquidationId'], args['loanId'], args['collateralAmount'],
+            args['amount'], args['endTime'], e['blockNumber'],
+            timestamp(e['blockNumber'])
+        ])
+        count += 1
+    for e in _events(events.LiquidationStopped, from_block, to_block):
+        args = e['args']
+        _append(store, 'stopped', [
+            args['liquidationId'], args['loanId'], args['bestBid'],
+            args['bestBidder'], e['blockNumber'],
+            timestamp(e['blockNumber'])
+        ])
+        count += 1
+    for e in _events(events.Withdrew, from_block, to_block):
+        args = e['args']
+        _append(store, 'withdrew',
+                [args['withdrawalAccount'], args['amount'], e['blockNumber']])
+        count += 1
+    # _type 0 is the collateral price, see oracles.vote
+    for e in _events(utils.contracts['oracles'].events.Update, from_block,
+                     to_block, {'_type': 0}):
+        _append(store, 'prices', [e['args']['_value'], e['blockNumber']])
+        count += 1
+    store['lastBlock'] = to_block
+    return count
+
+
+def _price_at(prices, block):
+    i = bisect.bisect_right(prices['block'], block)
+    if not i:
+        return None
+    return prices['price'][i - 1] / 10.0**18
+
+
+def auctions(store):
+    "Join started and stopped liquidations into one row per auction"
+
+    started = store['started']
+    index = {
+        liquidation_id: i
+        for i, liquidation_id in enumerate(started['liquidationId'])
+    }
+    stopped = store['stopped']
+    result = []
+    for liquidation_id, best_bid, bidder, block, stop_time in zip(
+            stopped['liquidationId'], stopped['bestBid'],
+            stopped['bestBidder'], stopped['block'], stopped['timestamp']):
+        i = index.get(liquidation_id)
+        if i is None:
+            continue
+        amount = started['amount'][i] / 10.0**18
+        collateral = started['collateral'][i] / 10.0**18
+        sold = int(bidder, 16) != 0 and best_bid > 0
+        price = amount / (best_bid / 10.0**18) if sold else None
+        oracle_price = _price_at(store['prices'], block)
+        result.append({
+            'liquidationId': liquidation_id,
+            'loanId': started['loanId'][i],
+            'collateral': collateral,
+            'amount': amount,
+            'bestBid': best_bid / 10.0**18,
+            'bestBidder': bidder if sold else None,
+            'price': price,
+            'oraclePrice': oracle_price,
+            'discount':
+            price / oracle_price - 1 if price and oracle_price else None,
+            'settleTime': stop_time - started['timestamp'][i],
+        })
+    return result
+
+
+def bidders(store, rows):
+    """Per bidder wins, share of the sold auctions and withdrawn dollars
+
+    There is no bid event, so the auctions a bidder lost are unknown and a
+    real win rate can not be computed."""
+
+    sold = [row for row in rows if row['bestBidder']]
+    result = {}
+    for row in sold:
+        bidder = result.setdefault(row['bestBidder'], {
+            'wins': 0,
+            'collateral': 0.0,
+            'paid': 0.0,
+            'withdrew': 0.0
+        })
+        bidder['wins'] += 1
+        bidder['collateral'] += row['bestBid']
+        bidder['paid'] += row['amount']
+    withdrew = store['withdrew']
+    for account, amount in zip(withdrew['account'], withdrew['amount']):
+        if account in result:
+            result[account]['withdrew'] += amount / 10.0**18
+    for bidder in result.values():
+        bidder['share'] = bidder['wins'] / float(len(sold))
+    return result
+
+
+def summary(rows):
+    sold = [row for row in rows if row['bestBidder']]
+    discounts = [row['discount'] for row in sold if row['discount'] is not None]
+    settle_times = sorted(row['settleTime'] for row in rows)
+    return {
+        'auctions': len(rows),
+        'sold': len(sold),
+        'unsold': len(rows) - len(sold),
+        'meanDiscount':
+        sum(discounts) / len(discounts) if discounts else None,
+        'medianSettleTime':
+        settle_times[len(settle_times) // 2] if settle_times else None,
+        'meanSettleTime':
+        sum(settle_times) / float(len(settle_times)) if settle_times else None,
+    }
@@ -0,0 +1,148 @@
+import time
+import heapq
+import click
+from . import transactions
+from . import utils
+
+# reverts of the same transaction before the keeper gives up on it
+MAX_REVERTS = 3
+# seconds before the first retry of a reverted transaction, doubled after
+# each revert
+BACKOFF = 30
+
+
+class Keeper(object):
+    """Stop expired liquidations and liquidate undercollateralised loans
+
+    Liquidation end times are kept in a heap and the loans below the
+    collateral ratio in a queue, both fed by the bank state listeners, so
+    each poll only looks at what became actionable. Transactions are sent
+    without waiting for receipts through a transactions.Sender. A reverted
+    transaction is retried with exponential backoff, and a loan whose
+    liquidation reverts MAX_REVERTS times is left alone until it changes."""
+
+    def __init__(self, bank, private_key, margin, timeout, dry_run):
+        self.bank = bank
+        self.margin = margin
+        self.dry_run = dry_run
+        self.sender = transactions.Sender(private_key, timeout)
+        self.end_times = []
+        self.liquidatable = {}
+        self.sent = set()
+        self.reverts = {}
+        self.given_up = {}
+        bank.listeners.append(self.on_change)
+
+    def on_change(self, kind, item):
+        if kind == 'liquidation':
+            heapq.heappush(self.end_times,
+                           (item['endTime'], item['liquidationId']))
+        elif kind == 'loan':
+            self.check_loan(item)
+        elif kind == 'variables':
+            for loan in self.bank.loans.values():
+                self.check_loan(loan)
+
+    @staticmethod
+    def snapshot(loan):
+        return loan['state'], loan['amount'], loan['collateral']
+
+    def check_loan(self, loan):
+        key = ('liquidate', loan['loanId'])
+        if loan['loanId'] in self.given_up:
+            if self.given_up[loan['loanId']] == self.snapshot(loan):
+                return
+            del self.given_up[loan['loanId']]
+        if loan['state'] == 'active' and loan['ratio'] < self.bank.variables[
+                'collateralRatio']:
+            self.liquidatable[loan['loanId']] = loan
+        else:
+            self.liquidatable.pop(loan['loanId'], None)
+            self.sent.discard(key)
+            self.reverts.pop(key, None)
+
+    def send(self, key, func):
+        if key in self.sent:
+            return
+        if key in self.reverts and self.reverts[key][1] > time.time():
+            return
+        if self.dry_run:
+            click.secho('{} {} (dry run)'.format(*key), fg='green')
+            self.sent.add(key)
+            return
+        try:
+            tx_hash = self.sender.send(key, func)
+        except Exception as e:
+            click.secho('{} {} failed: {}'.format(key[0], key[1], e),
+                        fg='red')
+            return
+        click.secho('{} {}\ttx: {}'.format(key[0], key[1], tx_hash),
+                    fg='green')
+        self.sent.add(key)
+
+    def reverted(self, key):
+        "Retry a reverted transaction after a backoff, or give up on it"
+
+        self.sent.discard(key)
+        count = self.reverts.get(key, (0, 0))[0] + 1
+        if count >= MAX_REVERTS:
+            click.secho('{} {} reverted {} times, giving up'.format(
+                key[0], key[1], count), fg='red')
+            self.reverts.pop(key, None)
+            if key[0] == 'liquidate':
+                loan = self.liquidatable.pop(key[1], None)
+                if loan is not None:
+                    self.given_up[key[1]] = self.snapshot(loan)
+            return
+        retry_at = time.time() + BACKOFF * 2**(count - 1)
+        self.reverts[key] = (count, retry_at)
+        if key[0] == 'stopLiquidation':
+            # the block time may lag behind, try again after the backoff
+            heapq.heappush(self.end_times, (int(retry_at), key[1]))
+
+    def check_receipts(self):
+        for key, status in self.sender.poll().items():
+            if status:
+                self.reverts.pop(key, None)
+                continue
+            if status is None:
+                click.secho('{} {} was dropped, resending'.format(*key),
+                            fg='red')
+                self.sent.discard(key)
+                if key[0] == 'stopLiquidation':
+                    heapq.heappush(self.end_times, (int(time.time()), key[1]))
+                continue
+            click.secho('{} {} reverted'.format(*key), fg='red')
+            self.reverted(key)
+
+    def act(self):
+        now = time.time()
+        while self.end_times and self.end_times[0][0] + self.margin <= now:
+            _, liquidation_id = heapq.heappop(self.end_times)
+            if liquidation_id in self.bank.liquidations:
+                func = utils.contracts['liquidator'].functions.stopLiquidation(
+                    liquidation_id)
+                self.send(('stopLiquidation', liquidation_id), func)
+        for loan_id in list(self.liquidatable):
+            func = utils.contracts['erc20bank'].functions.liquidate(loan_id)
+            self.send(('liquidate', loan_id), func)
+
+    def next_deadline(self):
+        if not self.end_times:
+            return None
+        return self.end_times[0][0] + self.margin
+
+    def run(self, interval):
+        while True:
+            try:
+                self.bank.sync(utils.default_deployment)
+                self.act()
+                self.check_receipts()
+            except Exception as e:
+                click.secho('Keeper error: {}'.format(e), fg='red')
+            deadline = self.next_deadline()
+            delay = interval
+            if deadline is not None:
+                delay = min(interval, max(0, deadline - time.time()))
+            time.sleep(delay)
+
@@ -1,6 +1,8 @@
 import time
 import sys
 import click
+from . import abi
+from . import history as _history
 from . import utils
 
 
@@ -65,22 +67,23 @@ def withdraw(private_key):
 
 
 @main.command()
-def active_liquidations():
+@click.option(
+    '--deployments',
+    callback=utils.check_deployments,
+    help='Comma separated deployments to query concurrently')
+def active_liquidations(deployments):
     "Get list of active liquidations"
 
     result = []
-    start_filter = utils.contracts[
-        'liquidator'].events.LiquidationStarted.createFilter(
-            fromBlock=1, toBlock='latest')
-    liquidations = utils.w3.eth.getLogs(start_filter.filter_params)
-    for liquidation_bytes in liquidations:
-        liquidation = start_filter.format_entry(liquidation_bytes)
-        liquidation_id = liquidation['args']['liquidationId']
-        liquidation = _show(liquidation_id)
-        if liquidation['amount'] != 0 and liquidation['state'] == 'active':
-            result.append(liquidation)
-    for liquidation in sorted(
-            result, key=lambda liquidation: liquidation['liquidationId']):
+    for name, liquidations in utils.for_deployments(deployments,
+                                                    _active_list):
+        result += [dict(liquidation, deployment=name)
+                   for liquidation in liquidations]
+    for liquidation in result:
+        if deployments:
+            click.secho(
+                'deployment:\t{}'.format(liquidation['deployment']),
+                fg='green')
         click.secho(
             'liquidationId:\t{}'.format(liquidation['liquidationId']),
             fg='green')
@@ -135,18 +138,123 @@ def show(liquidation_id):
     click.secho()
 
 
-def _show(liquidation_id):
+@main.command()
+@click.option(
+    '--sync/--no-sync',
+    default=True,
+    help='Ingest the new liquidator events before reporting')
+@click.option(
+    '--limit', type=int, default=20, help='Number of recent auctions to list')
+def history(sync, limit):
+    "Show the finished liquidations and bidders' statistics"
+
+    store = _history.load()
+    if sync:
+        count = _history.sync(store)
+        _history.save(store)
+        click.secho('{} new events up to block {}'.format(
+            count, store['lastBlock']))
+        click.secho()
+    rows = _history.auctions(store)
+    if not rows:
+        click.secho('There is no finished liquidation.', fg='green')
+        click.secho()
+        return
+    for row in rows[-limit:] if limit else rows:
+        click.secho(
+            'liquidationId:\t{}'.format(row['liquidationId']), fg='green')
+        click.secho('loanId:\t\t{}'.format(row['loanId']), fg='green')
+        click.secho(
+            'collateral:\t{} ether'.format(round(row['collateral'], 10)),
+            fg='green')
+        click.secho(
+            'loan:\t\t{} dollar'.format(round(row['amount'], 10)), fg='green')
+        click.secho(
+            'bestBid:\t{} ether'.format(round(row['bestBid'], 10)), fg='green')
+        click.secho('bidder:\t\t{}'.format(row['bestBidder']), fg='green')
+        if row['price'] is not None:
+            click.secho(
+                'price:\t\t{} ether dollar'.format(round(row['price'], 4)),
+                fg='green')
+        if row['discount'] is not None:
+            click.secho(
+                'oraclePrice:\t{0} ether dollar ({1:+.2%})'.format(
+                    round(row['oraclePrice'], 4), row['discount']),
+                fg='green')
+        click.secho(
+            'settleTime:\t{} minute'.format(round(row['settleTime'] / 60.0,
+                                                   1)),
+            fg='green')
+        click.secho()
+
+    result = _history.summary(rows)
+    click.secho('auctions:\t{}'.format(result['auctions']), fg='green')
+    click.secho('sold:\t\t{}'.format(result['sold']), fg='green')
+    click.secho('unsold:\t\t{}'.format(result['unsold']), fg='green')
+    if result['meanDiscount'] is not None:
+        click.secho(
+            'meanDiscount:\t{:+.2%}'.format(result['meanDiscount']),
+            fg='green')
+    click.secho(
+        'settleTime:\t{0} minute (median), {1} minute (mean)'.format(
+            round(result['medianSettleTime'] / 60.0, 1),
+            round(result['meanSettleTime'] / 60.0, 1)),
+        fg='green')
+    click.secho()
+
+    bidders = _history.bidders(store, rows)
+    for bidder, stats in sorted(
+            bidders.items(), key=lambda item: -item[1]['wins']):
+        click.secho('bidder:\t\t{}'.format(bidder), fg='green')
+        click.secho(
+            'wins:\t\t{0} ({1:.2%} of the sold auctions)'.format(
+                stats['wins'], stats['share']),
+            fg='green')
+        click.secho(
+            'collateral:\t{} ether'.format(round(stats['collateral'], 10)),
+            fg='green')
+        click.secho(
+            'paid:\t\t{} dollar'.format(round(stats['paid'], 10)), fg='green')
+        click.secho(
+            'withdrew:\t{} dollar'.format(round(stats['withdrew'], 10)),
+            fg='green')
+        click.secho()
+
+
+def _active_list(deployment=None):
+    d = deployment or utils.default_deployment
+    result = []
+    start_filter = d.contracts[
+        'liquidator'].events.LiquidationStarted.createFilter(
+            fromBlock=1, toBlock='latest')
+    liquidations = d.w3.eth.getLogs(start_filter.filter_params)
+    for liquidation_bytes in liquidations:
+        liquidation = start_filter.format_entry(liquidation_bytes)
+        liquidation_id = liquidation['args']['liquidationId']
+        liquidation = _show(liquidation_id, d)
+        if liquidation['amount'] != 0 and liquidation['state'] == 'active':
+            result.append(liquidation)
+    return sorted(
+        result, key=lambda liquidation: liquidation['liquidationId'])
+
+
+def _show(liquidation_id, deployment=None):
     liquidation_params = [
         'loanId', 'collateral', 'amount', 'endTime', 'bestBid', 'bestBidder',
         'state'
     ]
     liquidation_satates = ['active', 'finished']
-    liquidation = dict(
-        zip(
-            liquidation_params,
-            utils.send_eth_call(
-                utils.contracts['liquidator'].functions.liquidations(
-                    liquidation_id), None)))
+    d = deployment or utils.default_deployment
+    if d.generated('liquidator'):
+        values = abi.decode_liquidator_liquidations(
+            utils.send_raw_call(
+                'liquidator',
+                abi.encode_liquidator_liquidations(liquidation_id), None, d))
+    else:
+        values = utils.send_eth_call(
+            d.contracts['liquidator'].functions.liquidations(liquidation_id),
+            None)
+    liquidation = dict(zip(liquidation_params, values))
     liquidation['state'] = liquidation_satates[liquidation['state']]
     liquidation['liquidationId'] = liquidation_id
     return liquidation
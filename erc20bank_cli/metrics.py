@@ -0,0 +1,104 @@
+import time
+import threading
+import socketserver
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from . import state as _state
+
+
+def render(bank):
+    "The Prometheus text format of the bank state"
+
+    lines = [
+        '# HELP erc20bank_outstanding_dollar Ether dollar owed by open loans',
+        '# TYPE erc20bank_outstanding_dollar gauge',
+        'erc20bank_outstanding_dollar {}'.format(bank.amount / 10.0**18),
+        '# HELP erc20bank_locked_collateral Collateral locked in open loans',
+        '# TYPE erc20bank_locked_collateral gauge',
+        'erc20bank_locked_collateral {}'.format(bank.collateral / 10.0**18),
+        '# HELP erc20bank_loans Number of loans per state',
+        '# TYPE erc20bank_loans gauge',
+    ]
+    for loan_state in _state.LOAN_STATES:
+        lines.append('erc20bank_loans{{state="{}"}} {}'.format(
+            loan_state, bank.states[loan_state]))
+    lines += [
+        '# HELP erc20bank_collateral_ratio Collateralisation ratio of open '
+        'loans',
+        '# TYPE erc20bank_collateral_ratio histogram',
+    ]
+    count = 0
+    for bound, bucket in zip(_state.RATIO_BUCKETS, bank.buckets):
+        count += bucket
+        lines.append('erc20bank_collateral_ratio_bucket{{le="{}"}} {}'.format(
+            '+Inf' if bound == float('inf') else bound, count))
+    lines += [
+        'erc20bank_collateral_ratio_sum {}'.format(bank.ratio_sum),
+        'erc20bank_collateral_ratio_count {}'.format(count),
+        '# HELP erc20bank_active_liquidations Number of running liquidations',
+        '# TYPE erc20bank_active_liquidations gauge',
+        'erc20bank_active_liquidations {}'.format(len(bank.liquidations)),
+        '# HELP erc20bank_collateral_price Collateral price in ether dollar',
+        '# TYPE erc20bank_collateral_price gauge',
+        'erc20bank_collateral_price {}'.format(
+            bank.variables['collateralPrice']),
+        '# HELP erc20bank_collateral_ratio_min Minimum collateral ratio',
+        '# TYPE erc20bank_collateral_ratio_min gauge',
+        'erc20bank_collateral_ratio_min {}'.format(
+            bank.variables['collateralRatio']),
+        '# HELP erc20bank_liquidation_duration Liquidation duration in minutes',
+        '# TYPE erc20bank_liquidation_duration gauge',
+        'erc20bank_liquidation_duration {}'.format(
+            bank.variables['liquidationDuration']),
+        '# HELP erc20bank_last_block Last block applied to the metrics',
+        '# TYPE erc20bank_last_block gauge',
+        'erc20bank_last_block {}'.format(bank.last_block),
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+class Exporter(object):
+    "Keep the bank state in sync in the background and serve its metrics"
+
+    def __init__(self, bank, deployment, interval):
+        self.bank = bank
+        self.deployment = deployment
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.page = render(bank).encode()
+
+    def poll(self):
+        while True:
+            try:
+                with self.lock:
+                    if self.bank.sync(self.deployment):
+                        self.page = render(self.bank).encode()
+            except Exception as e:
+                print('Sync failed: {}'.format(e))
+            time.sleep(self.interval)
+
+    def serve(self, host, port):
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                page = exporter.page
+                self.send_response(200)
+                self.send_header('Content-Type',
+                                 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(page)))
+                self.end_headers()
+                self.wfile.write(page)
+
+            def log_message(self, *args):
+                pass
+
+        class Server(socketserver.ThreadingMixIn, HTTPServer):
+            daemon_threads = True
+
+        poller = threading.Thread(target=self.poll)
+        poller.daemon = True
+        poller.start()
+        Server((host, port), Handler).serve_forever()
@@ -0,0 +1,360 @@
+import time
+import gzip
+import json
+import atexit
+import threading
+import collections
+import requests
+from concurrent import futures
+from web3 import HTTPProvider
+from web3.providers.base import BaseProvider
+
+# weight of the newest sample in the moving latency average
+LATENCY_ALPHA = 0.3
+# consecutive failures which open the circuit of an endpoint
+MAX_FAILURES = 3
+# seconds an endpoint is skipped after its circuit opens
+COOLDOWN = 30
+# hedging delay used until an endpoint has enough latency samples
+DEFAULT_HEDGE_DELAY = 0.5
+# reads sent to the endpoints in configured order, so a lagging backup
+# does not hand out a stale nonce
+PINNED_METHODS = ('eth_getTransactionCount', )
+# JSON-RPC error codes of an endpoint which cannot serve a request right
+# now: limit exceeded and internal error
+UNAVAILABLE_CODES = (-32005, -32603)
+# messages of the generic server error -32000 which mean the same, other
+# -32000 errors like "nonce too low" or "already known" are about the
+# request and would get the same answer from every endpoint
+UNAVAILABLE_MESSAGES = ('header not found', 'missing trie node', 'rate limit',
+                        'too many requests', 'timeout', 'busy')
+
+
+class Endpoint(object):
+    "One JSON-RPC endpoint with its latency statistics and circuit breaker"
+
+    def __init__(self, uri):
+        self.uri = uri
+        self.provider = HTTPProvider(uri)
+        self.latency = None
+        self.samples = collections.deque(maxlen=100)
+        self.failures = 0
+        self.open_until = 0
+
+    def healthy(self):
+        return time.time() >= self.open_until
+
+    def p95(self):
+        if len(self.samples) < 10:
+            return DEFAULT_HEDGE_DELAY
+        samples = sorted(self.samples)
+        return samples[int(len(samples) * 0.95) - 1]
+
+    def succeeded(self, elapsed):
+        self.samples.append(elapsed)
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency += LATENCY_ALPHA * (elapsed - self.latency)
+        self.failures = 0
+
+    def failed(self):
+        self.failures += 1
+        if self.failures >= MAX_FAILURES:
+            self.open_until = time.time() + COOLDOWN
+            self.failures = 0
+
+    def _timed(self, send, *args):
+        start = time.time()
+        try:
+            response = send(*args)
+        except Exception as e:
+            if self.unavailable(e):
+                self.failed()
+            raise
+        if self.rejected(response):
+            self.failed()
+        else:
+            self.succeeded(time.time() - start)
+        return response
+
+    @staticmethod
+    def rejected(response):
+        """Whether the endpoint could not answer, like a rate limit or a
+        lagging node, as opposed to an error about the request itself"""
+
+        if isinstance(response, list):
+            return any(Endpoint.rejected(item) for item in response)
+        error = response.get('error')
+        if not error:
+            return False
+        if error.get('code') in UNAVAILABLE_CODES:
+            return True
+        message = str(error.get('message', '')).lower()
+        return any(text in message for text in UNAVAILABLE_MESSAGES)
+
+    @staticmethod
+    def unavailable(error):
+        "Whether a request which raised error should count as a failure"
+
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status = error.response.status_code
+            return status == 429 or status >= 500
+        return True
+
+    def request(self, method, params):
+        return self._timed(self.provider.make_request, method, params)
+
+    def batch(self, payload):
+        return self._timed(self._post, payload)
+
+    def _post(self, payload):
+        response = requests.post(
+            self.uri, json=payload, **self.provider.get_request_kwargs())
+        response.raise_for_status()
+        return response.json()
+
+
+class PoolProvider(BaseProvider):
+    """Route reads to the fastest healthy endpoint, broadcast transactions
+
+    Endpoints are ranked by their moving latency average; endpoints without
+    samples come first so they get measured. With hedge enabled a read that
+    takes longer than the p95 latency of its endpoint is also sent to the
+    next one and the first answer wins."""
+
+    def __init__(self, uris, hedge=False):
+        self.endpoints = [Endpoint(uri) for uri in uris]
+        self.hedge = hedge
+        self.executor = futures.ThreadPoolExecutor(
+            max_workers=2 * len(self.endpoints))
+        super(PoolProvider, self).__init__()
+
+    def __str__(self):
+        return 'RPC pool of {}'.format(', '.join(e.uri for e in self.endpoints))
+
+    def ranked(self):
+        healthy = [e for e in self.endpoints if e.healthy()]
+        if not healthy:
+            return sorted(self.endpoints, key=lambda e: e.open_until)
+        return sorted(
+            healthy, key=lambda e: -1 if e.latency is None else e.latency)
+
+    def make_request(self, method, params):
+        if method == 'eth_sendRawTransaction':
+            return self.broadcast(method, params)
+        if method in PINNED_METHODS:
+            endpoints = [e for e in self.endpoints if e.healthy()]
+            return self._first_working(endpoints or self.endpoints,
+                                       'request', method, params)
+        endpoints = self.ranked()
+        if self.hedge and len(endpoints) > 1:
+            return self.hedged(endpoints, method, params)
+        return self._first_working(endpoints, 'request', method, params)
+
+    def make_batch_request(self, payload):
+        return self._first_working(self.ranked(), 'batch', payload)
+
+    def _first_working(self, endpoints, send, *args):
+        response = error = None
+        for endpoint in endpoints:
+            try:
+                response = getattr(endpoint, send)(*args)
+            except Exception as e:
+                if not Endpoint.unavailable(e):
+                    raise
+                error = e
+                continue
+            if not Endpoint.rejected(response):
+                return response
+        if response is not None:
+            return response
+        raise error
+
+    def hedged(self, endpoints, method, params):
+        first = self.executor.submit(endpoints[0].request, method, params)
+        try:
+            response = first.result(timeout=endpoints[0].p95())
+        except futures.TimeoutError:
+            pass
+        except Exception as e:
+            if not Endpoint.unavailable(e):
+                raise
+            return self._first_working(endpoints[1:], 'request', method,
+                                       params)
+        else:
+            if not Endpoint.rejected(response):
+                return response
+            return self._first_working(endpoints[1:], 'request', method,
+                                       params)
+        pending = {
+            first,
+            self.executor.submit(endpoints[1].request, method, params)
+        }
+        response = error = None
+        while pending:
+            done, pending = futures.wait(
+                pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    if not Endpoint.unavailable(error):
+                        raise error
+                elif not Endpoint.rejected(future.result()):
+                    return future.result()
+                else:
+                    response = future.result()
+        if response is not None:
+            return response
+        raise error
+
+    def broadcast(self, method, params):
+        "Send to every endpoint at once and return the first accepted answer"
+
+        pending = {
+            self.executor.submit(e.request, method, params)
+            for e in self.endpoints
+        }
+        response = error = None
+        while pending:
+            done, pending = futures.wait(
+                pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                if 'error' not in future.result():
+                    return future.result()
+                response = response or future.result()
+        if response is not None:
+            return response
+        raise error
+
+    def isConnected(self):
+        return any(e.provider.isConnected() for e in self.endpoints)
+
+
+def _key(method, params):
+    return json.dumps([method, params], sort_keys=True, default=_encode)
+
+
+def _encode(value):
+    if isinstance(value, (bytes, bytearray)):
+        return '0x' + bytes(value).hex()
+    raise TypeError(repr(value))
+
+
+# path -> (file, lock) of the recordings, shared by the recording providers
+# of every deployment so their gzip members do not interleave
+_recordings = {}
+_recordings_lock = threading.Lock()
+
+
+def _recording(path):
+    with _recordings_lock:
+        if path not in _recordings:
+            f = gzip.open(path, 'at')
+            atexit.register(f.close)
+            _recordings[path] = (f, threading.Lock())
+        return _recordings[path]
+
+
+class RecordingProvider(BaseProvider):
+    """Pass requests to a provider and append every response to a gzip file
+
+    Each record names the deployment, so one file can hold the requests of
+    several deployments recorded at once."""
+
+    def __init__(self, provider, path, deployment=None):
+        self.provider = provider
+        self.path = path
+        self.deployment = deployment
+        self.file, self.lock = _recording(path)
+        super(RecordingProvider, self).__init__()
+
+    def _record(self, records):
+        lines = [
+            json.dumps({
+                'deployment': self.deployment,
+                'request': json.loads(_key(method, params)),
+                'response': response
+            }) for method, params, response in records
+        ]
+        with self.lock:
+            for line in lines:
+                self.file.write(line + '\n')
+            self.file.flush()
+
+    def make_request(self, method, params):
+        response = self.provider.make_request(method, params)
+        self._record([(method, params, response)])
+        return response
+
+    def make_batch_request(self, payload):
+        "Send the batch as is and record each of its items"
+
+        if hasattr(self.provider, 'make_batch_request'):
+            responses = self.provider.make_batch_request(payload)
+        else:
+            responses = requests.post(
+                self.provider.endpoint_uri,
+                json=payload,
+                **self.provider.get_request_kwargs()).json()
+        by_id = {response['id']: response for response in responses}
+        self._record([(item['method'], item['params'], by_id[item['id']])
+                      for item in payload if item['id'] in by_id])
+        return responses
+
+    def isConnected(self):
+        return self.provider.isConnected()
+
+
+class ReplayProvider(BaseProvider):
+    """Serve the responses of a recording instead of a node
+
+    Responses of the same request are served in recorded order and the
+    last one is repeated once they run out. Only the records of deployment
+    are served, records without a deployment match any. latency is slept
+    before each request to simulate a remote node."""
+
+    def __init__(self, path, latency=0, deployment=None):
+        self.path = path
+        self.latency = latency
+        self.deployment = deployment
+        self.lock = threading.Lock()
+        self.responses = collections.defaultdict(collections.deque)
+        with gzip.open(path, 'rt') as f:
+            for line in f:
+                record = json.loads(line)
+                if record.get('deployment', deployment) != deployment:
+                    continue
+                self.responses[json.dumps(
+                    record['request'], sort_keys=True)].append(
+                        record['response'])
+        super(ReplayProvider, self).__init__()
+
+    def _response(self, method, params):
+        with self.lock:
+            responses = self.responses.get(_key(method, params))
+            if not responses:
+                raise KeyError('{} {} was not recorded in {}'.format(
+                    method, params, self.path))
+            if len(responses) > 1:
+                return responses.popleft()
+            return responses[0]
+
+    def make_request(self, method, params):
+        if self.latency:
+            time.sleep(self.latency)
+        return self._response(method, params)
+
+    def make_batch_request(self, payload):
+        if self.latency:
+            time.sleep(self.latency)
+        return [
+            dict(self._response(item['method'], item['params']),
+                 id=item['id']) for item in payload
+        ]
+
+    def isConnected(self):
+        return True
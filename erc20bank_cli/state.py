@@ -0,0 +1,205 @@
+import bisect
+import functools
+import collections
+from . import abi
+
+# upper bounds of the collateralisation ratio histogram buckets
+RATIO_BUCKETS = [1.0, 1.25, 1.5, 1.75, 2.0, 2.5, 3.0, 4.0, 5.0, float('inf')]
+
+LOAN_STATES = ['active', 'under liquidation', 'liquidated', 'settled']
+
+# loans whose amount and collateral count as outstanding and locked
+OPEN_STATES = ('active', 'under liquidation')
+
+EVENTS = {
+    'erc20bank': [
+        'LoanGot', 'LoanSettled', 'CollateralIncreased',
+        'CollateralDecreased'
+    ],
+    'liquidator': ['LiquidationStarted', 'LiquidationStopped'],
+    'oracles': ['Update'],
+}
+
+
+def _event_decoders(deployment):
+    """topic -> decoder of the events the state is built from
+
+    A deployment which overrides a contract's ABI gets web3's generic
+    decoder for that contract, the generated ones assume the shipped layout."""
+
+    result = {}
+    for contract, names in EVENTS.items():
+        if deployment.generated(contract):
+            for name in names:
+                topic = abi.EVENT_TOPICS[contract][name]
+                result[topic] = abi.EVENT_DECODERS[contract][topic]
+            continue
+        from eth_utils import event_abi_to_log_topic
+        from web3.utils.events import get_event_data
+        for item in deployment.abies[contract]:
+            if item.get('type') == 'event' and item['name'] in names:
+                topic = '0x' + event_abi_to_log_topic(item).hex()
+                result[topic] = functools.partial(get_event_data, item)
+    return result
+
+
+class BankState(object):
+    """Loans, liquidations and oracle variables maintained from events
+
+    Every event updates the totals, the loan state counts and the ratio
+    histogram of the one loan it touches. Only a collateral price update
+    re-buckets the open loans."""
+
+    def __init__(self, variables):
+        self.variables = dict(variables)
+        self.loans = {}
+        self.liquidations = {}
+        self.amount = 0
+        self.collateral = 0
+        self.states = collections.Counter()
+        self.buckets = [0] * len(RATIO_BUCKETS)
+        self.ratio_sum = 0.0
+        self.last_block = 0
+        self.listeners = []
+        self._decoders = None
+
+    def ratio(self, loan):
+        if not loan['amount']:
+            return float('inf')
+        return loan['collateral'] * self.variables[
+            'collateralPrice'] / float(loan['amount'])
+
+    def _remove(self, loan):
+        self.states[loan['state']] -= 1
+        if loan['state'] in OPEN_STATES:
+            self.amount -= loan['amount']
+            self.collateral -= loan['collateral']
+            self.buckets[loan['bucket']] -= 1
+            if loan['amount']:
+                self.ratio_sum -= loan['ratio']
+
+    def _add(self, loan):
+        self.states[loan['state']] += 1
+        if loan['state'] in OPEN_STATES:
+            self.amount += loan['amount']
+            self.collateral += loan['collateral']
+            loan['ratio'] = self.ratio(loan)
+            loan['bucket'] = bisect.bisect_left(RATIO_BUCKETS, loan['ratio'])
+            self.buckets[loan['bucket']] += 1
+            if loan['amount']:
+                self.ratio_sum += loan['ratio']
+
+    def _update_loan(self, loan_id, **changes):
+        loan = self.loans.get(loan_id)
+        if loan is None:
+            return
+        self._remove(loan)
+        for key, value in changes.items():
+            if key in ('amount', 'collateral'):
+                loan[key] = max(0, loan[key] + value)
+            else:
+                loan[key] = value
+        self._add(loan)
+        for listener in self.listeners:
+            listener('loan', loan)
+
+    def _rebucket(self):
+        self.buckets = [0] * len(RATIO_BUCKETS)
+        self.ratio_sum = 0.0
+        for loan in self.loans.values():
+            if loan['state'] in OPEN_STATES:
+                loan['ratio'] = self.ratio(loan)
+                loan['bucket'] = bisect.bisect_left(RATIO_BUCKETS,
+                                                    loan['ratio'])
+                self.buckets[loan['bucket']] += 1
+                if loan['amount']:
+                    self.ratio_sum += loan['ratio']
+
+    def apply(self, event):
+        name, args = event['event'], event['args']
+        if name == 'LoanGot':
+            loan = {
+                'loanId': args['loanId'],
+                'recipient': args['recipient'],
+                'collateral': args['collateralAmount'],
+                'amount': args['amount'],
+                'state': 'active'
+            }
+            self.loans[args['loanId']] = loan
+            self._add(loan)
+            for listener in self.listeners:
+                listener('loan', loan)
+        elif name == 'LoanSettled':
+            loan = self.loans.get(args['loanId'])
+            changes = {}
+            if loan and loan['amount'] <= args['amount']:
+                changes['state'] = 'settled'
+            self._update_loan(
+                args['loanId'],
+                amount=-args['amount'],
+                collateral=-args['collateralAmount'],
+                **changes)
+        elif name == 'CollateralIncreased':
+            self._update_loan(
+                args['loanId'], collateral=args['collateralAmount'])
+        elif name == 'CollateralDecreased':
+            self._update_loan(
+                args['loanId'], collateral=-args['collateralAmount'])
+        elif name == 'LiquidationStarted':
+            self.liquidations[args['liquidationId']] = {
+                'liquidationId': args['liquidationId'],
+                'loanId': args['loanId'],
+                'collateral': args['collateralAmount'],
+                'amount': args['amount'],
+                'endTime': args['endTime']
+            }
+            self._update_loan(args['loanId'], state='under liquidation')
+            for listener in self.listeners:
+                listener('liquidation',
+                         self.liquidations[args['liquidationId']])
+        elif name == 'LiquidationStopped':
+            self.liquidations.pop(args['liquidationId'], None)
+            self._update_loan(args['loanId'], state='liquidated')
+        elif name == 'Update':
+            # the _type codes of oracles.vote
+            if args['_type'] == 0:
+                self.variables['collateralPrice'] = args['_value'] / 10.0**18
+                self._rebucket()
+            elif args['_type'] == 1:
+                self.variables['collateralRatio'] = args['_value'] / 1000.0
+            elif args['_type'] == 2:
+                self.variables['liquidationDuration'] = args['_value'] / 60.0
+            for listener in self.listeners:
+                listener('variables', self.variables)
+
+    def sync(self, deployment):
+        "Apply the events mined since the last sync with one eth_getLogs"
+
+        to_block = deployment.w3.eth.blockNumber
+        if to_block <= self.last_block:
+            return 0
+        logs = deployment.w3.eth.getLogs({
+            'fromBlock':
+            self.last_block + 1,
+            'toBlock':
+            to_block,
+            'address': [
+                deployment.addresses[contract] for contract in sorted(EVENTS)
+            ]
+        })
+        if self._decoders is None:
+            self._decoders = _event_decoders(deployment)
+        count = 0
+        for log in logs:
+            if not log['topics']:
+                continue
+            topic = log['topics'][0]
+            if not isinstance(topic, str):
+                topic = '0x' + bytes(topic).hex()
+            decoder = self._decoders.get(topic)
+            if decoder is None:
+                continue
+            self.apply(decoder(log))
+            count += 1
+        self.last_block = to_block
+        return count
@@ -0,0 +1,85 @@
+import collections
+
+
+def read_price_path(path, current_price):
+    "Read one price per line, a value like -30% is relative to current price"
+
+    prices = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.split('#')[0].strip()
+            if not line:
+                continue
+            if line.endswith('%'):
+                prices.append(current_price * (1 + float(line[:-1]) / 100.0))
+            else:
+                prices.append(float(line))
+    return prices
+
+
+def liquidation_prices(loans, collateral_ratio):
+    "Sort the active loans by the price below which they become liquidatable"
+
+    result = []
+    for loan in loans:
+        if loan['state'] != 'active' or not loan['amount']:
+            continue
+        if not loan['collateral']:
+            threshold = float('inf')
+        else:
+            threshold = collateral_ratio * loan['amount'] / loan['collateral']
+        result.append((threshold, loan))
+    result.sort(key=lambda item: -item[0])
+    return result
+
+
+def simulate(loans, variables, prices, step_minutes):
+    """Replay the prices over the loans and yield one report per step
+
+    Liquidated loans never come back, so the loans are walked once in
+    order of their liquidation price and every step only touches the
+    loans that cross it."""
+
+    thresholds = liquidation_prices(loans, variables['collateralRatio'])
+    duration = max(
+        1, int(round(variables['liquidationDuration'] / step_minutes)))
+    auctions = collections.deque()
+    under_auction = [0, 0]
+    total = {'loans': 0, 'collateral': 0, 'amount': 0}
+    i = 0
+    for step, price in enumerate(prices):
+        started = []
+        while i < len(thresholds) and thresholds[i][0] > price:
+            started.append(thresholds[i][1])
+            i += 1
+        collateral = sum(loan['collateral'] for loan in started)
+        amount = sum(loan['amount'] for loan in started)
+        if started:
+            auctions.append((step + duration, collateral, amount))
+            under_auction[0] += collateral
+            under_auction[1] += amount
+        settled = [0, 0]
+        while auctions and auctions[0][0] <= step:
+            _, auction_collateral, auction_amount = auctions.popleft()
+            settled[0] += auction_collateral
+            settled[1] += auction_amount
+        under_auction[0] -= settled[0]
+        under_auction[1] -= settled[1]
+        total['loans'] += len(started)
+        total['collateral'] += collateral
+        total['amount'] += amount
+        yield {
+            'step': step,
+            'price': price,
+            'liquidated': len(started),
+            'collateral': collateral,
+            'amount': amount,
+            'settledCollateral': settled[0],
+            'settledAmount': settled[1],
+            'auctionCollateral': under_auction[0],
+            'auctionAmount': under_auction[1],
+            'totalLoans': total['loans'],
+            'totalCollateral': total['collateral'],
+            'totalAmount': total['amount'],
+            'remaining': len(thresholds) - i,
+        }
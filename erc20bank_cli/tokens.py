@@ -0,0 +1,172 @@
+import os
+import json
+from . import abi
+from . import utils
+
+TOKENS = ['etherdollar', 'collateral']
+
+ZERO_ADDRESS = '0x' + '0' * 40
+
+# (token, method, args) -> value, dropped after our own transactions
+_cache = {}
+
+
+def _encode(token, method, *addresses):
+    return abi.SELECTORS[token][method] + ''.join(
+        bytes.fromhex(a[2:]).rjust(32, b'\0').hex() for a in addresses)
+
+
+def _call(token, method, args):
+    return ('eth_call', [{
+        'to': utils.addresses[token],
+        'data': _encode(token, method, *args)
+    }, 'latest'])
+
+
+def _fetch(token, method, keys):
+    missing = [k for k in keys if (token, method, k) not in _cache]
+    if missing:
+        results = utils.batch_request(
+            [_call(token, method, k) for k in missing])
+        for k, result in zip(missing, results):
+            _cache[(token, method, k)] = int(result[2:] or '0', 16)
+    return [_cache[(token, method, k)] for k in keys]
+
+
+def balances(token, owners):
+    "Balances of many owners with one batched request"
+
+    owners = [utils.w3.toChecksumAddress(owner) for owner in owners]
+    return dict(zip(owners, _fetch(token, 'balanceOf',
+                                   [(owner, ) for owner in owners])))
+
+
+def allowances(token, pairs):
+    "Allowances of many (owner, spender) pairs with one batched request"
+
+    pairs = [(utils.w3.toChecksumAddress(owner),
+              utils.w3.toChecksumAddress(spender)) for owner, spender in pairs]
+    return dict(zip(pairs, _fetch(token, 'allowance', pairs)))
+
+
+def balance_of(token, owner):
+    return list(balances(token, [owner]).values())[0]
+
+
+def allowance(token, owner, spender, cached=True):
+    if not cached:
+        invalidate(token)
+    return list(allowances(token, [(owner, spender)]).values())[0]
+
+
+def invalidate(token=None):
+    for key in list(_cache):
+        if token is None or key[0] == token:
+            del _cache[key]
+
+
+def ensure_allowance(token, spender, amount, private_key):
+    """Approve the spender only if the current allowance is not usable
+
+    getLoan and increaseCollateral take no collateral amount, the bank
+    transfers the whole collateral allowance, so it must equal amount.
+    settleLoan and placeBid name their amount, so any etherdollar
+    allowance that covers it is enough."""
+
+    spender = utils.w3.toChecksumAddress(spender)
+    owner = utils.priv2addr(private_key)
+    current = allowance(token, owner, spender, cached=False)
+    if current == amount or (token == 'etherdollar' and current >= amount):
+        return None
+    print('Approving {} {} transfer from your account by the contract'.format(
+        amount / 10.0**18, 'dollars' if token == 'etherdollar' else 'ether'))
+    func = utils.contracts[token].functions.approve(spender, amount)
+    tx_hash = utils.send_transaction(func, 0, private_key)
+    invalidate(token)
+    return tx_hash
+
+
+def _path():
+    return utils.default_deployment.cache_path('tokens')
+
+
+def load_index():
+    path = _path()
+    if not os.path.exists(path):
+        return {
+            token: {
+                'lastBlock': 0,
+                'balances': {},
+                'allowances': {}
+            }
+            for token in TOKENS
+        }
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_index(index):
+    path = _path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w') as f:
+        f.write(json.dumps(index))
+    os.replace(path + '.tmp', path)
+
+
+def sync_index(index):
+    """Replay the Transfer and Approval events mined since the last sync
+
+    transferFrom does not emit Approval, so the indexed allowances are the
+    last approved values and only an upper bound of the real ones."""
+
+    to_block = utils.w3.eth.blockNumber
+    for token in TOKENS:
+        state = index[token]
+        from_block = state['lastBlock'] + 1
+        if from_block > to_block:
+            continue
+        events = utils.contracts[token].events
+        transfer_filter = events.Transfer.createFilter(
+            fromBlock=from_block, toBlock=to_block)
+        for log in utils.w3.eth.getLogs(transfer_filter.filter_params):
+            args = transfer_filter.format_entry(log)['args']
+            balances = state['balances']
+            if args['from'] != ZERO_ADDRESS:
+                balances[args['from']] = balances.get(args['from'],
+                                                      0) - args['value']
+            if args['to'] != ZERO_ADDRESS:
+                balances[args['to']] = balances.get(args['to'],
+                                                    0) + args['value']
+        approval_filter = events.Approval.createFilter(
+            fromBlock=from_block, toBlock=to_block)
+        for log in utils.w3.eth.getLogs(approval_filter.filter_params):
+            args = approval_filter.format_entry(log)['args']
+            state['allowances'].setdefault(
+                args['owner'], {})[args['spender']] = args['value']
+        state['lastBlock'] = to_block
+    return index
+
+
+def indexed_balances(token, owners=None):
+    index = sync_index(load_index())
+    save_index(index)
+    result = index[token]['balances']
+    if owners is None:
+        return {owner: value for owner, value in result.items() if value}
+    owners = [utils.w3.toChecksumAddress(owner) for owner in owners]
+    return {owner: result.get(owner, 0) for owner in owners}
+
+
+
+def indexed_allowances(token, pairs):
+    """Allowances of (owner, spender) pairs from the local Approval index
+
+    They are the last approved values, an upper bound of the real ones."""
+
+    index = sync_index(load_index())
+    save_index(index)
+    result = index[token]['allowances']
+    pairs = [(utils.w3.toChecksumAddress(owner),
+              utils.w3.toChecksumAddress(spender)) for owner, spender in pairs]
+    return {(owner, spender): result.get(owner, {}).get(spender, 0)
+            for owner, spender in pairs}
@@ -0,0 +1,101 @@
+import time
+import click
+from . import config
+from . import utils
+
+# factor of each gas price bump, nodes replace a pending transaction only
+# when the new price is at least 10% higher
+GAS_PRICE_BUMP = 1.125
+
+
+class Sender(object):
+    """Send transactions with local nonces and follow them until mined
+
+    A transaction keeps its nonce for life. When it is not mined within
+    timeout seconds and its nonce is still unused, it is sent again at the
+    same nonce with a bumped gas price: that replaces it if it is stuck in
+    the mempool and refills the nonce if it was dropped, so no later nonce
+    stalls and nothing is sent twice."""
+
+    def __init__(self, private_key, timeout):
+        self.private_key = private_key
+        self.owner = utils.priv2addr(private_key)
+        self.timeout = timeout
+        self.nonces = utils.Nonces(self.owner)
+        self.pending = {}
+
+    def send(self, key, func):
+        nonce = self.nonces.take()
+        try:
+            tx_hash = utils.send_transaction(
+                func, 0, self.private_key, nonce=nonce, wait=False)
+        except Exception:
+            # the nonce was not used, read it again from the node
+            self.nonces.reset()
+            raise
+        self.pending[key] = {
+            'func': func,
+            'nonce': nonce,
+            'gasPrice': config.GAS_PRICE,
+            'hashes': [tx_hash],
+            'sentAt': time.time()
+        }
+        return tx_hash
+
+    def _receipt(self, tx):
+        for tx_hash in tx['hashes']:
+            receipt = utils.w3.eth.getTransactionReceipt(tx_hash)
+            if receipt is not None:
+                return receipt
+        return None
+
+    def _replace(self, key, tx):
+        gas_price = min(config.MAX_GAS_PRICE,
+                        int(tx['gasPrice'] * GAS_PRICE_BUMP))
+        tx['sentAt'] = time.time()
+        try:
+            tx_hash = utils.send_transaction(
+                tx['func'],
+                0,
+                self.private_key,
+                nonce=tx['nonce'],
+                wait=False,
+                gas_price=gas_price)
+        except Exception as e:
+            click.secho('{} {} not replaced: {}'.format(key[0], key[1], e),
+                        fg='red')
+            return
+        tx['gasPrice'] = gas_price
+        tx['hashes'].append(tx_hash)
+        click.secho(
+            '{} {} not mined in {} seconds, replaced at nonce {}\ttx: {}'.
+            format(key[0], key[1], self.timeout, tx['nonce'], tx_hash),
+            fg='red')
+
+    def poll(self):
+        """Return {key: status} of the transactions which are done
+
+        status is the receipt status, or None when the nonce was used by
+        a transaction of which there is no receipt."""
+
+        result = {}
+        expired = []
+        now = time.time()
+        for key, tx in list(self.pending.items()):
+            receipt = self._receipt(tx)
+            if receipt is not None:
+                result[key] = bool(receipt['status'])
+                del self.pending[key]
+            elif now - tx['sentAt'] >= self.timeout:
+                expired.append(key)
+        if expired:
+            mined = utils.w3.eth.getTransactionCount(self.owner, 'latest')
+            for key in expired:
+                tx = self.pending[key]
+                if tx['nonce'] >= mined:
+                    self._replace(key, tx)
+                # one of the hashes may have been mined since the receipts
+                elif self._receipt(tx) is None:
+                    result[key] = None
+                    del self.pending[key]
+        return result
@@ -1,79 +1,160 @@
 import os
 import sys
 import json
+import threading
 import click
-from eth_keys import keys
+import requests
+from concurrent import futures
 from web3 import Web3, HTTPProvider
+from . import abi
+from . import accounts
 from . import config
+from . import rpc
 
 
-def get_addresses(erc20bank_addr):
-    global addresses
-    erc20bank_contract = w3.eth.contract(
-        address=w3.toChecksumAddress(config.ERC20BANK_ADDR),
-        abi=config.ABIES['erc20bank'])
-    addresses = {
-        'collateral':
-        w3.toChecksumAddress(config.COLLATERAL_ADDR),
-        'erc20bank':
-        erc20bank_addr,
-        'oracles':
-        send_eth_call(erc20bank_contract.functions.oraclesAddr(), None),
-        'liquidator':
-        send_eth_call(erc20bank_contract.functions.liquidatorAddr(), None),
-        'etherdollar':
-        send_eth_call(erc20bank_contract.functions.etherDollarAddr(), None)
-    }
-    return addresses
+class Deployment(object):
+    "The web3 connection, addresses and contracts of one bank deployment"
 
+    def __init__(self, name, profile):
+        self.name = name
+        self.profile = profile
+        self.provider = get_provider(profile.get('rpc_urls'), name)
+        self.w3 = Web3(self.provider)
+        use_get_logs(self.w3)
+        self.abies = dict(abi.ABIES, **profile.get('abies', {}))
+        self.chain = None
+        self.addresses = self.load_addresses()
+        self.contracts = Contracts(self)
 
-def get_contracts():
-    global contracts
-    contracts = {
-        'collateral':
-        w3.eth.contract(
-            address=addresses['collateral'], abi=config.ABIES['collateral']),
+    def cache_path(self, kind=None):
+        "The file of this deployment's cached addresses or of another store"
+
+        if self.chain is None:
+            self.chain = self.chain_id()
+        name = self.name if kind is None else '{}.{}'.format(self.name, kind)
+        return os.path.expanduser('~/.erc20bank/{}/{}.json'.format(
+            self.chain, name))
+
+    def chain_id(self):
+        "eth_chainId, or the network id from nodes which predate it"
+
+        try:
+            return int(
+                self.w3.manager.request_blocking('eth_chainId', []), 16)
+        except ValueError:
+            return int(self.w3.version.network)
+
+    def generated(self, contract):
+        "Whether the generated codecs of abi.py fit the contract's ABI"
+
+        return self.abies[contract] == abi.ABIES[contract]
+
+    def load_addresses(self):
+        erc20bank_addr = self.w3.toChecksumAddress(self.profile['erc20bank'])
+        path = self.cache_path()
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                addresses = json.load(f)
+            if addresses['erc20bank'] == erc20bank_addr:
+                return addresses
+        addresses = self.get_addresses(erc20bank_addr)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(json.dumps(addresses))
+        return addresses
+
+    def get_addresses(self, erc20bank_addr):
+        erc20bank_contract = self.w3.eth.contract(
+            address=erc20bank_addr, abi=self.abies['erc20bank'])
+        return {
+            'collateral':
+            self.w3.toChecksumAddress(self.profile['collateral']),
+            'erc20bank':
+            erc20bank_addr,
+            'oracles':
+            send_eth_call(erc20bank_contract.functions.oraclesAddr(), None),
+            'liquidator':
+            send_eth_call(erc20bank_contract.functions.liquidatorAddr(),
+                          None),
+            'etherdollar':
+            send_eth_call(erc20bank_contract.functions.etherDollarAddr(),
+                          None)
+        }
+
+
+class Contracts(dict):
+    "Build the web3 contract objects on first use"
+
+    def __init__(self, deployment):
+        super(Contracts, self).__init__()
+        self.deployment = deployment
+
+    def __missing__(self, name):
+        d = self.deployment
+        self[name] = d.w3.eth.contract(
+            address=d.addresses[name], abi=d.abies[name])
+        return self[name]
+
+
+def get_profile(name):
+    if name in config.DEPLOYMENTS:
+        return config.DEPLOYMENTS[name]
+    if name != 'default':
+        click.secho('There is no deployment named {}.'.format(name), fg='red')
+        click.secho()
+        sys.exit()
+    return {
         'erc20bank':
-        w3.eth.contract(
-            address=addresses['erc20bank'], abi=config.ABIES['erc20bank']),
-        'oracles':
-        w3.eth.contract(
-            address=addresses['oracles'], abi=config.ABIES['oracles']),
-        'liquidator':
-        w3.eth.contract(
-            address=addresses['liquidator'], abi=config.ABIES['liquidator']),
-        'etherdollar':
-        w3.eth.contract(
-            address=addresses['etherdollar'], abi=config.ABIES['etherdollar'])
+        os.environ.get('ERC20BANK_CONTRACTADDRESS', config.ERC20BANK_ADDR),
+        'collateral':
+        config.COLLATERAL_ADDR
     }
-    return contracts
+
+
+def get_deployment(name):
+    if name not in deployments:
+        deployments[name] = Deployment(name, get_profile(name))
+    return deployments[name]
+
+
+def check_deployments(ctx, param, value):
+    if not value:
+        return None
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def for_deployments(names, func):
+    """Run func(deployment) on every named deployment concurrently
+
+    Return [(name, result), ...] in the order of names; without names func
+    runs once on the default deployment."""
+
+    if not names:
+        return [(default_deployment.name, func(default_deployment))]
+    current_user()
+    with futures.ThreadPoolExecutor(max_workers=len(names)) as executor:
+        jobs = [
+            executor.submit(lambda name: func(get_deployment(name)), name)
+            for name in names
+        ]
+        return [(name, job.result()) for name, job in zip(names, jobs)]
 
 
 def approve_collateral(spender, collateral, private_key):
-    print('Approving {} dollars transfer from your account by the contract'.
-          format(collateral))
-    spender = w3.toChecksumAddress(spender)
-    func = contracts['collateral'].functions.approve(spender,
-                                                     int(collateral * 10**18))
-    tx_hash = send_transaction(func, 0, private_key)
-    w3.eth.waitForTransactionReceipt(tx_hash)
-    return tx_hash
+    from . import tokens
+    return tokens.ensure_allowance('collateral', spender,
+                                   int(collateral * 10**18), private_key)
 
 
 def approve_dollar(spender, dollar, private_key):
-    print('Approving {} dollars transfer from your account by the contract'.
-          format(dollar))
-    spender = w3.toChecksumAddress(spender)
-    func = contracts['etherdollar'].functions.approve(spender,
-                                                      int(dollar * 10**18))
-    tx_hash = send_transaction(func, 0, private_key)
-    w3.eth.waitForTransactionReceipt(tx_hash)
-    return tx_hash
+    from . import tokens
+    return tokens.ensure_allowance('etherdollar', spender,
+                                   int(dollar * 10**18), private_key)
 
 
 def check_account(ctx, param, value):
-    if not value and 'ERC20BANK_PRIVATEKEY' in os.environ:
-        value = os.environ['ERC20BANK_PRIVATEKEY']
+    if not value and accounts.configured():
+        value = accounts.default().private_key
     if not value:
         print(
             'Run:\n\texport ERC20BANK_PRIVATEKEY="your ethereum private key"')
@@ -130,27 +211,62 @@ def check_dollar(ctx, param, value):
     return value
 
 
+def check_minutes(ctx, param, value):
+    if value <= 0:
+        click.secho('Error: minutes must be a positive number', fg='red')
+        click.secho()
+        sys.exit()
+    return value
+
+
 def priv2addr(private_key):
-    pk = keys.PrivateKey(bytes.fromhex(private_key))
-    return pk.public_key.to_checksum_address()
+    return accounts.from_private_key(private_key).address
+
+
+class Nonces(object):
+    "Hand out consecutive nonces to send transactions without waiting"
+
+    def __init__(self, address):
+        self.address = address
+        self.lock = threading.Lock()
+        self.next = None
 
+    def take(self):
+        with self.lock:
+            if self.next is None:
+                self.next = w3.eth.getTransactionCount(self.address,
+                                                       'pending')
+            nonce = self.next
+            self.next += 1
+            return nonce
 
-def send_transaction(func, value, private_key):
+    def reset(self):
+        with self.lock:
+            self.next = None
+
+
+def send_transaction(func, value, private_key, nonce=None, wait=True,
+                     gas_price=None):
+    account = accounts.from_private_key(private_key)
+    if nonce is None:
+        nonce = w3.eth.getTransactionCount(account.address)
     transaction = func.buildTransaction({
         'nonce':
-        w3.eth.getTransactionCount(priv2addr(private_key)),
+        nonce,
         'from':
-        priv2addr(private_key),
+        account.address,
         'value':
         value,
         'gas':
         config.GAS,
         'gasPrice':
-        config.GAS_PRICE
+        gas_price or config.GAS_PRICE
     })
-    signed = w3.eth.account.signTransaction(transaction, private_key)
+    signed = account.sign_transaction(transaction)
     raw_transaction = signed.rawTransaction.hex()
     tx_hash = w3.eth.sendRawTransaction(raw_transaction).hex()
+    if not wait:
+        return tx_hash
     rec = w3.eth.waitForTransactionReceipt(tx_hash)
     if rec['status']:
         click.secho('tx: {}'.format(tx_hash), fg='green')
@@ -162,15 +278,16 @@ def send_transaction(func, value, private_key):
 
 
 def send_eth(contract_addr, value, private_key):
+    account = accounts.from_private_key(private_key)
     transaction = {
-        'nonce': w3.eth.getTransactionCount(priv2addr(private_key)),
-        'from': priv2addr(private_key),
+        'nonce': w3.eth.getTransactionCount(account.address),
+        'from': account.address,
         'value': value,
         'gas': config.GAS,
         'to': contract_addr,
         'gasPrice': config.GAS_PRICE
     }
-    signed = w3.eth.account.signTransaction(transaction, private_key)
+    signed = account.sign_transaction(transaction)
     raw_transaction = signed.rawTransaction.hex()
     tx_hash = w3.eth.sendRawTransaction(raw_transaction).hex()
     rec = w3.eth.waitForTransactionReceipt(tx_hash)
@@ -192,49 +309,105 @@ def send_eth_call(func, sender):
     return result
 
 
-def current_user():
-    return priv2addr(os.environ['ERC20BANK_PRIVATEKEY'])
+def send_raw_call(contract, data, sender, deployment=None):
+    d = deployment or default_deployment
+    if not sender:
+        sender = current_user()
+    result = d.w3.eth.call({
+        'from': sender,
+        'to': d.addresses[contract],
+        'data': '0x' + data.hex(),
+    })
+    return result
 
 
-def start():
-    global addresses, contracts, w3
-    w3 = Web3(HTTPProvider(config.INFURA_URL))
-    if 'ERC20BANK_PRIVATEKEY' not in os.environ:
-        print(
-            'Run:\n\t export ERC20BANK_PRIVATEKEY="your ethereum private key"')
-        sys.exit()
+def batch_request(calls):
+    "Send [(method, params), ...] as one JSON-RPC batch, return the results"
 
-    if os.path.exists(os.path.expanduser('~/.erc20bank.json')):
-        with open(os.path.expanduser('~/.erc20bank.json'), 'r') as f:
-            addresses = json.load(f)
-    elif 'ERC20BANK_CONTRACTADDRESS' in os.environ:
-        try:
-            addresses = get_addresses(os.environ['ERC20BANK_CONTRACTADDRESS'])
-            with open(os.path.expanduser('~/.erc20bank.json'), 'w') as f:
-                f.write(json.dumps(addresses))
-        except:
-            print('First edit the ERC20BANK_CONTRACTADDRESS and try again')
-            sys.exit()
+    payload = [{
+        'jsonrpc': '2.0',
+        'id': i,
+        'method': method,
+        'params': params
+    } for i, (method, params) in enumerate(calls)]
+    if hasattr(provider, 'make_batch_request'):
+        responses = provider.make_batch_request(payload)
     else:
-        addresses = get_addresses(w3.toChecksumAddress(config.ERC20BANK_ADDR))
-        with open(os.path.expanduser('~/.erc20bank.json'), 'w') as f:
-            f.write(json.dumps(addresses))
-    get_contracts()
+        responses = requests.post(
+            provider.endpoint_uri, json=payload,
+            **provider.get_request_kwargs()).json()
+    responses = {response['id']: response for response in responses}
+    results = []
+    for i in range(len(calls)):
+        if 'error' in responses[i]:
+            raise ValueError(responses[i]['error'])
+        results.append(responses[i]['result'])
+    return results
 
 
-# we are initalizing some variables here
-addresses = contracts = w3 = None
-start()
+def current_user():
+    return accounts.default().address
+
+
+def get_provider(urls=None, deployment=None):
+    if 'ERC20BANK_REPLAY' in os.environ:
+        return rpc.ReplayProvider(
+            os.environ['ERC20BANK_REPLAY'],
+            float(os.environ.get('ERC20BANK_REPLAY_LATENCY', 0)) / 1000.0,
+            deployment)
+    if urls:
+        pass
+    elif 'ERC20BANK_RPC_URLS' in os.environ:
+        urls = os.environ['ERC20BANK_RPC_URLS'].split(',')
+    else:
+        urls = config.RPC_URLS or [config.INFURA_URL]
+    if len(urls) == 1:
+        result = HTTPProvider(urls[0])
+    else:
+        result = rpc.PoolProvider(
+            urls, hedge=bool(os.environ.get('ERC20BANK_RPC_HEDGE')))
+    if 'ERC20BANK_RECORD' in os.environ:
+        result = rpc.RecordingProvider(result, os.environ['ERC20BANK_RECORD'],
+                                       deployment)
+    return result
 
 
 # FIXME: infura not supports filtering of events.
 # Here we are hacking web3.py filters to use getLogs rpc endpoint instead.
-def dummy(*args, **argsdic):
-    if len(args) > 0 and args[0] == 'eth_newFilter':
-        return 0
-    else:
-        return original_request_blocking(*args, **argsdic)
+def use_get_logs(web3):
+    original_request_blocking = web3.manager.request_blocking
+
+    def dummy(*args, **argsdic):
+        if len(args) > 0 and args[0] == 'eth_newFilter':
+            return 0
+        else:
+            return original_request_blocking(*args, **argsdic)
 
+    web3.manager.request_blocking = dummy
 
-original_request_blocking = w3.manager.request_blocking
-w3.manager.request_blocking = dummy
+
+def start():
+    global addresses, contracts, default_deployment, provider, w3
+    if not accounts.configured():
+        print(
+            'Run:\n\t export ERC20BANK_PRIVATEKEY="your ethereum private key"'
+            '\nor:\n\t export ERC20BANK_ACCOUNT="your keystore account name"')
+        sys.exit()
+    try:
+        default_deployment = get_deployment(
+            os.environ.get('ERC20BANK_DEPLOYMENT', 'default'))
+    except Exception:
+        if 'ERC20BANK_CONTRACTADDRESS' not in os.environ:
+            raise
+        print('First edit the ERC20BANK_CONTRACTADDRESS and try again')
+        sys.exit()
+    provider = default_deployment.provider
+    w3 = default_deployment.w3
+    addresses = default_deployment.addresses
+    contracts = default_deployment.contracts
+
+
+# we are initalizing some variables here
+addresses = contracts = default_deployment = provider = w3 = None
+deployments = {}
+start()
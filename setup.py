@@ -29,6 +29,7 @@ setup(
     install_requires=[
         "web3",
         "click",
+        "requests",
         "asn1crypto",
         "cffi",
         "pysha3"
@@ -49,6 +50,3 @@ setup(
         'Programming Language :: Python :: 3.7',
     ],
 )
-
-if os.path.exists(os.path.expanduser('~/.erc20bank.json')):
-    os.remove(os.path.expanduser('~/.erc20bank.json'))
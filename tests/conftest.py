@@ -0,0 +1,7 @@
+import pytest
+import fakes
+
+
+@pytest.fixture
+def chain():
+    return fakes.install()
@@ -0,0 +1,105 @@
+import sys
+import types
+import erc20bank_cli
+
+# erc20bank_cli.utils connects to a node when it is imported, so the
+# modules which send transactions are tested against this stand-in
+utils = types.ModuleType('erc20bank_cli.utils')
+sys.modules['erc20bank_cli.utils'] = utils
+erc20bank_cli.utils = utils
+
+OWNER = '0x' + '11' * 20
+BANK = '0x' + '22' * 20
+
+
+class Functions(object):
+    def __init__(self, contract):
+        self.contract = contract
+
+    def __getattr__(self, name):
+        return lambda *args: (self.contract, name) + args
+
+
+class Contracts(dict):
+    def __missing__(self, name):
+        self[name] = types.SimpleNamespace(functions=Functions(name))
+        return self[name]
+
+
+class Chain(object):
+    """The node behind the stand-in: sent transactions, their receipts and
+    the mined nonce of the owner"""
+
+    def __init__(self):
+        self.transactions = []
+        self.receipts = {}
+        self.mined = 0
+        self.errors = []
+
+    # utils.send_transaction
+    def send_transaction(self, func, value, private_key, nonce=None,
+                         wait=True, gas_price=None):
+        # errors are raised by the next sends in order, None lets one through
+        error = self.errors.pop(0) if self.errors else None
+        if error is not None:
+            raise error
+        tx_hash = '0x{:064x}'.format(len(self.transactions))
+        self.transactions.append({
+            'func': func,
+            'nonce': nonce,
+            'gasPrice': gas_price,
+            'hash': tx_hash
+        })
+        return tx_hash
+
+    # utils.w3.eth
+    def getTransactionReceipt(self, tx_hash):
+        return self.receipts.get(tx_hash)
+
+    def getTransactionCount(self, address, block='latest'):
+        if block == 'pending':
+            return max([self.mined] + [
+                tx['nonce'] + 1 for tx in self.transactions
+                if tx['nonce'] is not None
+            ])
+        return self.mined
+
+    def mine(self, tx_hash, status=1):
+        tx = [tx for tx in self.transactions if tx['hash'] == tx_hash][0]
+        self.receipts[tx_hash] = {'status': status}
+        self.mined = max(self.mined, tx['nonce'] + 1)
+
+    def funcs(self):
+        return [tx['func'] for tx in self.transactions]
+
+
+class Nonces(object):
+    def __init__(self, address):
+        self.address = address
+        self.next = None
+
+    def take(self):
+        if self.next is None:
+            self.next = utils.w3.eth.getTransactionCount(
+                self.address, 'pending')
+        nonce = self.next
+        self.next += 1
+        return nonce
+
+    def reset(self):
+        self.next = None
+
+
+def install():
+    "Point the stand-in at a new chain and return it"
+
+    chain = Chain()
+    utils.w3 = types.SimpleNamespace(
+        eth=chain, toChecksumAddress=lambda address: address)
+    utils.send_transaction = chain.send_transaction
+    utils.priv2addr = lambda private_key: OWNER
+    utils.Nonces = Nonces
+    utils.contracts = Contracts()
+    utils.addresses = {'erc20bank': BANK}
+    utils.default_deployment = None
+    return chain
@@ -0,0 +1,81 @@
+import pytest
+
+eth_utils = pytest.importorskip('eth_utils')
+
+from erc20bank_cli import abi  # noqa: E402
+
+ADDRESS = eth_utils.to_checksum_address('0x' + 'ab' * 20)
+
+
+def word(value):
+    return value.to_bytes(32, 'big')
+
+
+def address_word(address):
+    return b'\x00' * 12 + bytes.fromhex(address[2:])
+
+
+def signature(item):
+    return '{}({})'.format(item['name'], ','.join(
+        arg['type'] for arg in item['inputs']))
+
+
+def test_selectors_and_topics():
+    for contract, items in abi.ABIES.items():
+        for item in items:
+            if item['type'] == 'function':
+                assert abi.SELECTORS[contract][item['name']] == \
+                    '0x' + eth_utils.keccak(text=signature(item))[:4].hex()
+            elif item['type'] == 'event':
+                assert abi.EVENT_TOPICS[contract][item['name']] == \
+                    '0x' + eth_utils.keccak(text=signature(item)).hex()
+
+
+def test_loans_codec():
+    assert abi.encode_erc20bank_loans(5) == bytes.fromhex(
+        abi.SELECTORS['erc20bank']['loans'][2:]) + word(5)
+    data = address_word(ADDRESS) + word(10) + word(20) + word(1)
+    assert abi.decode_erc20bank_loans(data) == (ADDRESS, 10, 20, 1)
+
+
+def test_liquidations_codec():
+    assert abi.encode_liquidator_liquidations(3) == bytes.fromhex(
+        abi.SELECTORS['liquidator']['liquidations'][2:]) + word(3)
+    data = b''.join(word(v) for v in (1, 2, 3, 4, 5))
+    data += address_word(ADDRESS) + word(2)
+    assert abi.decode_liquidator_liquidations(data) == (1, 2, 3, 4, 5,
+                                                        ADDRESS, 2)
+
+
+def test_event_decoders():
+    topic = abi.EVENT_TOPICS['erc20bank']['LoanGot']
+    log = {
+        'topics': [topic, '0x' + address_word(ADDRESS).hex(),
+                   '0x' + word(4).hex()],
+        'data': '0x' + (word(100) + word(200)).hex(),
+        'blockNumber': 12,
+        'logIndex': 3,
+        'transactionHash': '0x' + '00' * 32,
+    }
+    event = abi.EVENT_DECODERS['erc20bank'][topic](log)
+    assert event['event'] == 'LoanGot'
+    assert event['args'] == {
+        'recipient': ADDRESS,
+        'loanId': 4,
+        'amount': 100,
+        'collateralAmount': 200
+    }
+    assert event['blockNumber'] == 12 and event['logIndex'] == 3
+
+
+def test_event_decoders_take_bytes():
+    topic = abi.EVENT_TOPICS['oracles']['Update']
+    log = {
+        'topics': [bytes.fromhex(topic[2:]), word(1)],
+        'data': word(1750),
+        'blockNumber': 1,
+        'logIndex': 0,
+        'transactionHash': b'\x00' * 32,
+    }
+    event = abi.EVENT_DECODERS['oracles'][topic](log)
+    assert event['args'] == {'_type': 1, '_value': 1750}
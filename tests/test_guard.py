@@ -0,0 +1,155 @@
+import pytest
+
+pytest.importorskip('eth_utils')
+
+from erc20bank_cli import guard  # noqa: E402
+from erc20bank_cli import state  # noqa: E402
+
+from fakes import BANK, OWNER  # noqa: E402
+
+VARIABLES = {
+    'collateralPrice': 2.0,
+    'collateralRatio': 1.5,
+    'liquidationDuration': 60.0
+}
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1000000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(guard.time, 'time', clock)
+    return clock
+
+
+def make_guard(max_top_ups=5, window=3600, cooldown=300):
+    bank = state.BankState(VARIABLES)
+    return bank, guard.Guard(bank, 'key', 0.1, 0.25, max_top_ups, window,
+                             cooldown, 300, False)
+
+
+def loan_got(loan_id, amount, collateral, recipient=OWNER):
+    return {
+        'event': 'LoanGot',
+        'args': {
+            'recipient': recipient,
+            'loanId': loan_id,
+            'amount': amount,
+            'collateralAmount': collateral
+        }
+    }
+
+
+def decreased(loan_id, collateral):
+    return {
+        'event': 'CollateralDecreased',
+        'args': {
+            'loanId': loan_id,
+            'collateralAmount': collateral
+        }
+    }
+
+
+def test_needed(chain):
+    bank, g = make_guard()
+    bank.apply(loan_got(1, 100, 80))
+    bank.apply(loan_got(2, 100, 90))
+    bank.apply(loan_got(3, 100, 10, recipient=BANK))
+    # up to 1.875 = 1.5 * (1 + 0.25) at a price of 2
+    assert g.needed(bank.loans[1]) == 14
+    assert g.needed(bank.loans[2]) == 0
+    assert g.needed(bank.loans[3]) == 0
+
+
+def test_approve_and_increase_take_consecutive_nonces(chain, clock):
+    chain.mined = 7
+    bank, g = make_guard()
+    bank.apply(loan_got(1, 100, 80))
+    bank.apply(loan_got(2, 100, 80))
+    g.act()
+    assert chain.funcs() == [
+        ('collateral', 'approve', BANK, 14),
+        ('erc20bank', 'increaseCollateral', 1),
+        ('collateral', 'approve', BANK, 14),
+        ('erc20bank', 'increaseCollateral', 2),
+    ]
+    assert [tx['nonce'] for tx in chain.transactions] == [7, 8, 9, 10]
+    assert not g.pending
+
+
+def test_rate_limited_loan_is_checked_again(chain, clock):
+    bank, g = make_guard(max_top_ups=1, window=600)
+    bank.apply(loan_got(1, 100, 80))
+    bank.apply(loan_got(2, 100, 80))
+    g.act()
+    assert len(chain.transactions) == 2
+    assert g.pending == {2}
+    clock.now += 599
+    g.act()
+    assert len(chain.transactions) == 2
+    clock.now += 1
+    g.act()
+    assert chain.funcs()[2:] == [('collateral', 'approve', BANK, 14),
+                                 ('erc20bank', 'increaseCollateral', 2)]
+
+
+def test_cooldown_is_checked_again(chain, clock):
+    bank, g = make_guard(cooldown=300)
+    bank.apply(loan_got(1, 100, 80))
+    g.act()
+    for tx in chain.transactions:
+        chain.mine(tx['hash'])
+    g.check_receipts()
+    bank.apply({
+        'event': 'CollateralIncreased',
+        'args': {
+            'loanId': 1,
+            'collateralAmount': 14
+        }
+    })
+    bank.apply(decreased(1, 14))
+    g.act()
+    assert len(chain.transactions) == 2
+    clock.now += 300
+    g.act()
+    assert len(chain.transactions) == 4
+
+
+def test_failed_top_up_is_queued_again(chain, clock):
+    bank, g = make_guard()
+    bank.apply(loan_got(1, 100, 80))
+    g.act()
+    approve, increase = chain.transactions
+    chain.mine(approve['hash'])
+    g.act()
+    assert len(chain.transactions) == 2
+    chain.mine(increase['hash'], status=0)
+    g.check_receipts()
+    assert g.pending == {1}
+    g.act()
+    assert chain.funcs()[2:] == [('collateral', 'approve', BANK, 14),
+                                 ('erc20bank', 'increaseCollateral', 1)]
+
+
+def test_unsent_increase_keeps_the_loan_pending(chain, clock):
+    bank, g = make_guard()
+    bank.apply(loan_got(1, 100, 80))
+    chain.errors = [None, ValueError('connection reset')]
+    g.act()
+    assert g.pending == {1}
+    assert g.in_flight == {1: {('approve', 1)}}
+    g.act()
+    assert len(chain.transactions) == 1
+    chain.mine(chain.transactions[0]['hash'])
+    g.check_receipts()
+    g.act()
+    assert chain.funcs()[1:] == [('collateral', 'approve', BANK, 14),
+                                 ('erc20bank', 'increaseCollateral', 1)]
+    assert [tx['nonce'] for tx in chain.transactions] == [0, 1, 2]
@@ -0,0 +1,183 @@
+import pytest
+
+pytest.importorskip('eth_utils')
+
+from erc20bank_cli import config  # noqa: E402
+from erc20bank_cli import keeper  # noqa: E402
+from erc20bank_cli import state  # noqa: E402
+
+from fakes import OWNER  # noqa: E402
+
+VARIABLES = {
+    'collateralPrice': 2.0,
+    'collateralRatio': 1.5,
+    'liquidationDuration': 60.0
+}
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1000000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(keeper.time, 'time', clock)
+    return clock
+
+
+def make_keeper(timeout=300):
+    bank = state.BankState(VARIABLES)
+    return bank, keeper.Keeper(bank, 'key', 15, timeout, False)
+
+
+def loan_got(loan_id, amount, collateral):
+    return {
+        'event': 'LoanGot',
+        'args': {
+            'recipient': OWNER,
+            'loanId': loan_id,
+            'amount': amount,
+            'collateralAmount': collateral
+        }
+    }
+
+
+def started(liquidation_id, loan_id, end_time):
+    return {
+        'event': 'LiquidationStarted',
+        'args': {
+            'liquidationId': liquidation_id,
+            'loanId': loan_id,
+            'collateralAmount': 100,
+            'amount': 100,
+            'endTime': end_time
+        }
+    }
+
+
+def test_stop_liquidation_after_margin(chain, clock):
+    bank, k = make_keeper()
+    bank.apply(loan_got(1, 100, 100))
+    bank.apply(loan_got(2, 100, 100))
+    bank.apply(started(1, 1, int(clock.now) - 10))
+    bank.apply(started(2, 2, int(clock.now) - 20))
+    k.act()
+    assert chain.funcs() == [('liquidator', 'stopLiquidation', 2)]
+    assert k.next_deadline() == clock.now + 5
+    clock.now += 5
+    k.act()
+    assert chain.funcs()[1:] == [('liquidator', 'stopLiquidation', 1)]
+    assert not k.end_times
+
+
+def test_liquidate_once(chain, clock):
+    bank, k = make_keeper()
+    bank.apply(loan_got(1, 100, 50))
+    bank.apply(loan_got(2, 100, 100))
+    k.act()
+    k.act()
+    assert chain.funcs() == [('erc20bank', 'liquidate', 1)]
+    chain.mine(chain.transactions[0]['hash'])
+    k.check_receipts()
+    k.act()
+    assert len(chain.transactions) == 1
+
+
+def test_reverted_liquidate_backs_off(chain, clock):
+    bank, k = make_keeper()
+    bank.apply(loan_got(1, 100, 50))
+    k.act()
+    for count in range(1, keeper.MAX_REVERTS):
+        chain.mine(chain.transactions[-1]['hash'], status=0)
+        k.check_receipts()
+        k.act()
+        assert len(chain.transactions) == count
+        clock.now += keeper.BACKOFF * 2**(count - 1) - 1
+        k.act()
+        assert len(chain.transactions) == count
+        clock.now += 1
+        k.act()
+        assert len(chain.transactions) == count + 1
+    chain.mine(chain.transactions[-1]['hash'], status=0)
+    k.check_receipts()
+    clock.now += 10**6
+    k.act()
+    assert len(chain.transactions) == keeper.MAX_REVERTS
+    # a price update does not change the loan
+    bank.apply({'event': 'Update', 'args': {'_type': 0, '_value': 10**18}})
+    k.act()
+    assert len(chain.transactions) == keeper.MAX_REVERTS
+    bank.apply({
+        'event': 'CollateralDecreased',
+        'args': {
+            'loanId': 1,
+            'collateralAmount': 10
+        }
+    })
+    k.act()
+    assert len(chain.transactions) == keeper.MAX_REVERTS + 1
+
+
+def test_stuck_transaction_is_replaced_at_its_nonce(chain, clock):
+    bank, k = make_keeper(timeout=60)
+    bank.apply(loan_got(1, 100, 50))
+    bank.apply(loan_got(2, 100, 50))
+    k.act()
+    assert [tx['nonce'] for tx in chain.transactions] == [0, 1]
+    clock.now += 59
+    k.check_receipts()
+    assert len(chain.transactions) == 2
+    clock.now += 1
+    k.check_receipts()
+    replaced = chain.transactions[2:]
+    assert [tx['nonce'] for tx in replaced] == [0, 1]
+    assert [tx['gasPrice'] for tx in replaced] == [
+        int(config.GAS_PRICE * 1.125)
+    ] * 2
+    # the original is mined after all
+    chain.mine(chain.transactions[0]['hash'])
+    chain.mine(replaced[1]['hash'])
+    k.check_receipts()
+    assert not k.sender.pending
+    k.act()
+    assert len(chain.transactions) == 4
+
+
+def test_gas_price_bump_is_capped(chain, clock):
+    bank, k = make_keeper(timeout=60)
+    bank.apply(loan_got(1, 100, 50))
+    k.act()
+    for _ in range(30):
+        clock.now += 60
+        k.check_receipts()
+    assert max(tx['gasPrice'] or 0
+               for tx in chain.transactions) == config.MAX_GAS_PRICE
+    assert {tx['nonce'] for tx in chain.transactions} == {0}
+
+
+def test_dropped_nonce_is_resent(chain, clock):
+    bank, k = make_keeper(timeout=60)
+    bank.apply(loan_got(1, 100, 50))
+    k.act()
+    # another transaction of the account took the nonce
+    chain.mined = 1
+    clock.now += 60
+    k.check_receipts()
+    k.act()
+    assert [tx['nonce'] for tx in chain.transactions] == [0, 1]
+    assert chain.funcs()[1] == ('erc20bank', 'liquidate', 1)
+
+
+def test_failed_send_resets_nonces(chain, clock):
+    bank, k = make_keeper()
+    bank.apply(loan_got(1, 100, 50))
+    chain.errors.append(ValueError('insufficient funds'))
+    k.act()
+    assert not chain.transactions
+    k.act()
+    assert [tx['nonce'] for tx in chain.transactions] == [0]
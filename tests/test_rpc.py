@@ -0,0 +1,162 @@
+import time
+from concurrent import futures
+import pytest
+
+pytest.importorskip('web3')
+
+from erc20bank_cli import rpc  # noqa: E402
+
+
+class Provider(object):
+    "Answers every request with answer(method, params) after delay seconds"
+
+    def __init__(self, answer, delay=0):
+        self.answer = answer
+        self.delay = delay
+        self.calls = 0
+
+    def make_request(self, method, params):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if isinstance(self.answer, Exception):
+            raise self.answer
+        return dict(self.answer, id=1, jsonrpc='2.0')
+
+
+def result(value):
+    return {'result': value}
+
+
+def error(code, message):
+    return {'error': {'code': code, 'message': message}}
+
+
+def pool(*providers, **kwargs):
+    provider = rpc.PoolProvider(
+        ['http://node{}'.format(i) for i in range(len(providers))],
+        **kwargs)
+    for endpoint, fake in zip(provider.endpoints, providers):
+        endpoint.provider = fake
+    return provider
+
+
+def test_ranked_by_latency():
+    provider = pool(*[Provider(result('0x1')) for _ in range(3)])
+    a, b, c = provider.endpoints
+    a.succeeded(0.3)
+    b.succeeded(0.1)
+    assert provider.ranked() == [c, b, a]
+    c.succeeded(0.2)
+    assert provider.ranked() == [b, c, a]
+    # the moving average follows new samples gradually
+    a.succeeded(0.0)
+    assert provider.ranked()[0] is b
+    for _ in range(3):
+        a.succeeded(0.0)
+    assert provider.ranked()[0] is a
+
+
+def test_circuit_opens_after_max_failures():
+    down = Provider(ConnectionError('refused'))
+    up = Provider(result('0x1'))
+    provider = pool(down, up)
+    for _ in range(rpc.MAX_FAILURES):
+        assert provider.make_request('eth_blockNumber', [])['result'] == '0x1'
+    assert not provider.endpoints[0].healthy()
+    assert provider.ranked() == [provider.endpoints[1]]
+    provider.make_request('eth_blockNumber', [])
+    assert down.calls == rpc.MAX_FAILURES
+
+
+@pytest.mark.parametrize('answer', [
+    error(-32005, 'limit exceeded'),
+    error(-32000, 'header not found'),
+    error(-32603, 'internal error'),
+])
+def test_unavailable_endpoint_is_skipped(answer):
+    lagging = Provider(answer)
+    provider = pool(lagging, Provider(result('0x1')))
+    assert provider.make_request('eth_call', [])['result'] == '0x1'
+    assert provider.endpoints[0].failures == 1
+
+
+@pytest.mark.parametrize('answer', [
+    error(-32000, 'nonce too low'),
+    error(-32000, 'insufficient funds for gas * price + value'),
+    error(-32602, 'invalid argument 0'),
+    error(-32000, 'execution reverted'),
+])
+def test_request_errors_are_not_failures(answer):
+    first, second = Provider(answer), Provider(result('0x1'))
+    provider = pool(first, second)
+    assert provider.make_request('eth_call', [])['error'] == answer['error']
+    assert second.calls == 0
+    assert provider.endpoints[0].failures == 0
+
+
+def test_hedge_after_p95():
+    slow, fast = Provider(result('slow'), delay=0.5), Provider(result('fast'))
+    provider = pool(slow, fast, hedge=True)
+    for _ in range(10):
+        provider.endpoints[0].succeeded(0.05)
+    provider.endpoints[1].succeeded(1)
+    assert provider.endpoints[0].p95() == 0.05
+    start = time.time()
+    assert provider.make_request('eth_call', [])['result'] == 'fast'
+    assert time.time() - start < 0.4
+    assert fast.calls == 1
+
+
+def test_no_hedge_before_p95():
+    first, second = Provider(result('first')), Provider(result('second'))
+    provider = pool(first, second, hedge=True)
+    provider.endpoints[1].succeeded(1)
+    assert provider.make_request('eth_call', [])['result'] == 'first'
+    assert second.calls == 0
+
+
+def test_broadcast_first_success_wins():
+    known = Provider(error(-32000, 'already known'))
+    slow = Provider(result('0xslow'), delay=0.3)
+    fast = Provider(result('0xfast'), delay=0.05)
+    provider = pool(known, slow, fast)
+    response = provider.make_request('eth_sendRawTransaction', ['0x00'])
+    assert response['result'] == '0xfast'
+    assert known.calls == slow.calls == fast.calls == 1
+    assert all(e.failures == 0 for e in provider.endpoints)
+
+
+def test_broadcast_error_is_returned():
+    provider = pool(*[Provider(error(-32000, 'nonce too low'))] * 2)
+    response = provider.make_request('eth_sendRawTransaction', ['0x00'])
+    assert response['error']['message'] == 'nonce too low'
+    assert all(e.failures == 0 for e in provider.endpoints)
+
+
+def test_pinned_methods_keep_configured_order():
+    first, second = Provider(result('0x5')), Provider(result('0x4'))
+    provider = pool(first, second)
+    provider.endpoints[1].succeeded(0.01)
+    provider.endpoints[0].succeeded(1)
+    response = provider.make_request('eth_getTransactionCount',
+                                     ['0x0', 'pending'])
+    assert response['result'] == '0x5'
+
+
+def test_deployments_record_to_one_file(tmp_path):
+    path = str(tmp_path / 'run.jsonl.gz')
+    recorders = [
+        rpc.RecordingProvider(Provider(result(name)), path, name)
+        for name in ('a', 'b')
+    ]
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        for _ in range(200):
+            for recorder in recorders:
+                executor.submit(recorder.make_request, 'net_version', [])
+    # the recording is complete once its file is closed at exit
+    rpc._recordings.pop(path)[0].close()
+    for name in ('a', 'b'):
+        replay = rpc.ReplayProvider(path, deployment=name)
+        assert len(replay.responses[rpc._key('net_version', [])]) == 200
+        assert replay.make_request('net_version', [])['result'] == name
@@ -0,0 +1,149 @@
+import pytest
+
+pytest.importorskip('eth_utils')
+
+from erc20bank_cli import state  # noqa: E402
+
+OWNER = '0x' + '11' * 20
+VARIABLES = {
+    'collateralPrice': 2.0,
+    'collateralRatio': 1.5,
+    'liquidationDuration': 60.0
+}
+
+
+def event(name, **args):
+    return {'event': name, 'args': args}
+
+
+def loan_got(loan_id, amount, collateral):
+    return event(
+        'LoanGot',
+        recipient=OWNER,
+        loanId=loan_id,
+        amount=amount,
+        collateralAmount=collateral)
+
+
+def check_invariants(bank):
+    "The running totals match a recount from the loans"
+
+    open_loans = [
+        loan for loan in bank.loans.values()
+        if loan['state'] in state.OPEN_STATES
+    ]
+    assert bank.amount == sum(loan['amount'] for loan in open_loans)
+    assert bank.collateral == sum(loan['collateral'] for loan in open_loans)
+    assert sum(bank.buckets) == len(open_loans)
+    assert sum(bank.states.values()) == len(bank.loans)
+    for loan_state in state.LOAN_STATES:
+        assert bank.states[loan_state] == len([
+            loan for loan in bank.loans.values()
+            if loan['state'] == loan_state
+        ])
+    buckets = [0] * len(state.RATIO_BUCKETS)
+    for loan in open_loans:
+        ratio = bank.ratio(loan)
+        assert loan['ratio'] == pytest.approx(ratio)
+        assert ratio <= state.RATIO_BUCKETS[loan['bucket']]
+        if loan['bucket']:
+            assert ratio > state.RATIO_BUCKETS[loan['bucket'] - 1]
+        buckets[loan['bucket']] += 1
+    assert bank.buckets == buckets
+    assert bank.ratio_sum == pytest.approx(
+        sum(loan['ratio'] for loan in open_loans if loan['amount']))
+
+
+def test_loan_got():
+    bank = state.BankState(VARIABLES)
+    bank.apply(loan_got(1, 100, 100))
+    loan = bank.loans[1]
+    assert loan['state'] == 'active'
+    assert loan['ratio'] == 2.0
+    assert bank.amount == 100 and bank.collateral == 100
+    check_invariants(bank)
+
+
+def test_collateral_changes_move_buckets():
+    bank = state.BankState(VARIABLES)
+    bank.apply(loan_got(1, 100, 100))
+    bank.apply(event('CollateralIncreased', loanId=1, collateralAmount=100))
+    assert bank.loans[1]['ratio'] == 4.0
+    check_invariants(bank)
+    bank.apply(event('CollateralDecreased', loanId=1, collateralAmount=150))
+    assert bank.loans[1]['ratio'] == 1.0
+    check_invariants(bank)
+
+
+def test_settle():
+    bank = state.BankState(VARIABLES)
+    bank.apply(loan_got(1, 100, 100))
+    bank.apply(loan_got(2, 100, 100))
+    bank.apply(
+        event('LoanSettled', loanId=1, amount=40, collateralAmount=40))
+    assert bank.loans[1]['state'] == 'active'
+    check_invariants(bank)
+    bank.apply(
+        event('LoanSettled', loanId=1, amount=60, collateralAmount=60))
+    assert bank.loans[1]['state'] == 'settled'
+    assert bank.amount == 100 and bank.collateral == 100
+    check_invariants(bank)
+
+
+def test_liquidation():
+    bank = state.BankState(VARIABLES)
+    bank.apply(loan_got(1, 100, 60))
+    bank.apply(
+        event(
+            'LiquidationStarted',
+            liquidationId=7,
+            loanId=1,
+            collateralAmount=60,
+            amount=100,
+            endTime=1000))
+    assert bank.loans[1]['state'] == 'under liquidation'
+    assert bank.liquidations[7]['endTime'] == 1000
+    check_invariants(bank)
+    bank.apply(
+        event(
+            'LiquidationStopped',
+            liquidationId=7,
+            loanId=1,
+            bestBid=50,
+            bestBidder=OWNER))
+    assert bank.loans[1]['state'] == 'liquidated'
+    assert not bank.liquidations
+    assert bank.amount == 0 and bank.collateral == 0
+    check_invariants(bank)
+
+
+def test_price_update_rebuckets():
+    bank = state.BankState(VARIABLES)
+    for loan_id, collateral in enumerate([50, 100, 200, 400]):
+        bank.apply(loan_got(loan_id, 100, collateral))
+    check_invariants(bank)
+    bank.apply(event('Update', _type=0, _value=3 * 10**18))
+    assert bank.variables['collateralPrice'] == 3.0
+    check_invariants(bank)
+    bank.apply(event('Update', _type=1, _value=1750))
+    bank.apply(event('Update', _type=2, _value=7200))
+    assert bank.variables['collateralRatio'] == 1.75
+    assert bank.variables['liquidationDuration'] == 120.0
+    check_invariants(bank)
+
+
+def test_listeners():
+    bank = state.BankState(VARIABLES)
+    calls = []
+    bank.listeners.append(lambda kind, item: calls.append(kind))
+    bank.apply(loan_got(1, 100, 100))
+    bank.apply(event('CollateralIncreased', loanId=1, collateralAmount=1))
+    bank.apply(event('Update', _type=0, _value=10**18))
+    assert calls == ['loan', 'loan', 'variables']
+
+
+def test_unknown_loan_is_ignored():
+    bank = state.BankState(VARIABLES)
+    bank.apply(event('CollateralIncreased', loanId=9, collateralAmount=1))
+    assert not bank.loans
+    check_invariants(bank)
@@ -0,0 +1,61 @@
+from erc20bank_cli import stress
+
+VARIABLES = {
+    'collateralPrice': 2.0,
+    'collateralRatio': 1.5,
+    'liquidationDuration': 30.0
+}
+
+
+def loan(loan_id, amount, collateral, loan_state='active'):
+    return {
+        'loanId': loan_id,
+        'amount': amount,
+        'collateral': collateral,
+        'state': loan_state
+    }
+
+
+LOANS = [
+    loan(1, 100, 100),  # liquidatable below 1.5
+    loan(2, 100, 150),  # below 1.0
+    loan(3, 100, 300),  # below 0.5
+    loan(4, 100, 100, 'settled'),
+    loan(5, 0, 100),
+]
+
+
+def test_liquidation_prices():
+    prices = stress.liquidation_prices(LOANS, 1.5)
+    assert [item[1]['loanId'] for item in prices] == [1, 2, 3]
+    assert [item[0] for item in prices] == [1.5, 1.0, 0.5]
+
+
+def test_simulate():
+    reports = list(stress.simulate(LOANS, VARIABLES, [2.0, 1.2, 0.9, 0.9],
+                                   10))
+    assert [r['liquidated'] for r in reports] == [0, 1, 1, 0]
+    assert [r['remaining'] for r in reports] == [3, 2, 1, 1]
+    assert reports[-1]['totalLoans'] == 2
+    assert reports[-1]['totalCollateral'] == 250
+    assert reports[-1]['totalAmount'] == 200
+    # the auctions take three steps of ten minutes
+    assert [r['auctionCollateral'] for r in reports] == [0, 100, 250, 250]
+    assert reports[3]['settledCollateral'] == 0
+
+
+def test_simulate_settles_auctions():
+    reports = list(
+        stress.simulate(LOANS, VARIABLES, [1.2, 1.2, 1.2, 1.2, 0.1], 10))
+    assert reports[3]['settledCollateral'] == 100
+    assert reports[3]['settledAmount'] == 100
+    assert reports[3]['auctionCollateral'] == 0
+    assert reports[4]['liquidated'] == 2
+    assert reports[4]['totalLoans'] == 3
+    assert reports[4]['remaining'] == 0
+
+
+def test_read_price_path(tmp_path):
+    path = tmp_path / 'prices.txt'
+    path.write_text('# a crash\n1.5\n\n-50%  # half\n+10%\n')
+    assert stress.read_price_path(str(path), 2.0) == [1.5, 1.0, 2.2]
@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip('eth_utils')
+
+from erc20bank_cli import tokens  # noqa: E402
+
+from fakes import BANK, OWNER  # noqa: E402
+
+
+@pytest.fixture
+def current(chain, monkeypatch):
+    "The allowance the stubbed token reports"
+
+    current = {'value': 0}
+    monkeypatch.setattr(tokens, 'allowance',
+                        lambda token, owner, spender, cached=True: current[
+                            'value'])
+    return current
+
+
+@pytest.mark.parametrize('value, approved', [(0, True), (10, False),
+                                             (11, True), (5, True)])
+def test_collateral_allowance_must_equal(chain, current, value, approved):
+    current['value'] = value
+    tx_hash = tokens.ensure_allowance('collateral', BANK, 10, 'key')
+    assert (tx_hash is not None) == approved
+    if approved:
+        assert chain.funcs() == [('collateral', 'approve', BANK, 10)]
+    else:
+        assert not chain.transactions
+
+
+@pytest.mark.parametrize('value, approved', [(0, True), (10, False),
+                                             (11, False), (5, True)])
+def test_dollar_allowance_may_exceed(chain, current, value, approved):
+    current['value'] = value
+    tx_hash = tokens.ensure_allowance('etherdollar', BANK, 10, 'key')
+    assert (tx_hash is not None) == approved
+
+
+def test_indexed_allowances(chain, monkeypatch):
+    index = {
+        token: {
+            'lastBlock': 5,
+            'balances': {},
+            'allowances': {
+                OWNER: {
+                    BANK: 7
+                }
+            }
+        }
+        for token in tokens.TOKENS
+    }
+    monkeypatch.setattr(tokens, 'load_index', lambda: index)
+    monkeypatch.setattr(tokens, 'sync_index', lambda index: index)
+    monkeypatch.setattr(tokens, 'save_index', lambda index: None)
+    result = tokens.indexed_allowances('etherdollar', [(OWNER, BANK),
+                                                       (BANK, OWNER)])
+    assert result == {(OWNER, BANK): 7, (BANK, OWNER): 0}